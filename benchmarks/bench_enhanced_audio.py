@@ -0,0 +1,571 @@
+"""
+Offline microbenchmarks for the enhanced_audio cog.
+
+Times queue page rendering, the Now Playing embed build and the unchanged-state check of
+``EnhancedAudioView.update_now_playing`` against fake Lavalink players with queues of
+10 to 10,000 tracks. discord.py, Red-Lavalink and Red are replaced by small stubs, so the
+numbers measure the cog's own work and do not need a bot, a network or those packages.
+
+Usage:
+    python benchmarks/bench_enhanced_audio.py
+    python benchmarks/bench_enhanced_audio.py --save baseline.json
+    python benchmarks/bench_enhanced_audio.py --compare baseline.json --threshold 0.2
+
+With ``--compare`` the exit status is 1 if the median time of any benchmark got slower than
+the baseline's by more than ``--threshold`` (a fraction, 0.2 = 20%) plus the run-to-run noise
+of both runs. The noise is the median absolute deviation of the rounds, relative to their median.
+"""
+
+import argparse
+import asyncio
+import enum
+import gc
+import importlib
+import json
+import statistics
+import sys
+import time
+import types
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+QUEUE_SIZES = (10, 100, 1000, 10000)
+NOISE_MARGIN = 3  # Noise widths a median may move before it counts as a regression
+
+
+# ---------------------------------------------------------------------------
+# Stubs for discord.py, Red-Lavalink and Red
+# ---------------------------------------------------------------------------
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+def _passthrough(*_args, **_kwargs):
+    def decorator(func):
+        return func
+
+    return decorator
+
+
+class _Snowflake:
+    def __init__(self, id=0, **kwargs):
+        self.id = id
+        self.__dict__.update(kwargs)
+
+
+class _HTTPException(Exception):
+    def __init__(self, status=500, code=0):
+        super().__init__(status, code)
+        self.status = status
+        self.code = code
+
+
+class _Embed:
+    def __init__(self, *, title=None, description=None, color=None, url=None):
+        self.title = title
+        self.description = description
+        self.color = color
+        self.url = url
+        self.fields = []
+        self.author = self.thumbnail = self.footer = None
+
+    @classmethod
+    def from_dict(cls, data):
+        embed = cls(
+            title=data.get("title"), description=data.get("description"),
+            color=data.get("color"), url=data.get("url"),
+        )
+        embed.fields = [dict(f) for f in data.get("fields", [])]
+        embed.author = data.get("author")
+        embed.thumbnail = data.get("thumbnail")
+        embed.footer = data.get("footer")
+        return embed
+
+    def add_field(self, *, name, value, inline=True):
+        self.fields.append({"name": name, "value": value, "inline": inline})
+        return self
+
+    def set_author(self, *, name, url=None, icon_url=None):
+        self.author = {"name": name, "url": url, "icon_url": icon_url}
+        return self
+
+    def set_thumbnail(self, *, url):
+        self.thumbnail = {"url": url}
+        return self
+
+    def set_footer(self, *, text, icon_url=None):
+        self.footer = {"text": text}
+        return self
+
+    def to_dict(self):
+        data = {"type": "rich"}
+        for key in ("title", "description", "color", "url", "author", "thumbnail", "footer"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        if self.fields:
+            data["fields"] = self.fields
+        return data
+
+
+class _View:
+    def __init__(self, *, timeout=180.0):
+        self.timeout = timeout
+        self.children = []
+        self._finished = False
+
+    def add_item(self, item):
+        self.children.append(item)
+
+    def is_finished(self):
+        return self._finished
+
+    def stop(self):
+        self._finished = True
+
+    def to_components(self):
+        return []
+
+
+class _Button:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class _Loop:
+    def __init__(self, func):
+        self.func = func
+
+    def __get__(self, instance, owner):
+        return self
+
+    def start(self, *args, **kwargs):
+        return None
+
+    def cancel(self):
+        return None
+
+
+class _Command:
+    def __init__(self, func):
+        self.callback = func
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return types.MethodType(self.callback, instance)
+
+    def command(self, *args, **kwargs):
+        return lambda func: _Command(func)
+
+
+class _Group:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    def command(self, *args, **kwargs):
+        return _passthrough()
+
+
+class _Cog:
+    @staticmethod
+    def listener(*_args, **_kwargs):
+        return _passthrough()
+
+
+class _Range:
+    def __class_getitem__(cls, item):
+        return int
+
+
+class _LavalinkEvents(enum.Enum):
+    TRACK_END = "TrackEndEvent"
+    TRACK_EXCEPTION = "TrackExceptionEvent"
+    TRACK_STUCK = "TrackStuckEvent"
+    TRACK_START = "TrackStartEvent"
+    WEBSOCKET_CLOSED = "WebSocketClosedEvent"
+    QUEUE_END = "QueueEndEvent"
+
+
+_players = {}
+
+
+def _get_player(guild_id):
+    try:
+        return _players[guild_id]
+    except KeyError:
+        raise KeyError("No such player for that guild.")
+
+
+def install_stubs():
+    ui = _module("discord.ui", View=_View, Button=_Button, button=_passthrough)
+    app_commands = _module(
+        "discord.app_commands", command=_passthrough, describe=_passthrough,
+        Group=_Group, Range=_Range,
+    )
+    ext = _module("discord.ext")
+    ext.tasks = _module("discord.ext.tasks", loop=lambda **kwargs: _Loop)
+    abc = _module("discord.abc", Snowflake=_Snowflake, Messageable=object)
+    utils = _module(
+        "discord.utils",
+        get=lambda iterable, **attrs: next(
+            (i for i in iterable if all(getattr(i, k, None) == v for k, v in attrs.items())), None
+        ),
+        find=lambda predicate, iterable: next((i for i in iterable if predicate(i)), None),
+    )
+    _module(
+        "discord",
+        ui=ui, app_commands=app_commands, ext=ext, abc=abc, utils=utils,
+        Embed=_Embed, ButtonStyle=types.SimpleNamespace(
+            primary=1, secondary=2, success=3, danger=4
+        ),
+        Interaction=object, Guild=object, Member=object, User=object, Message=object,
+        PartialMessage=object, Object=_Snowflake,
+        RawMessageDeleteEvent=object, RawBulkMessageDeleteEvent=object,
+        HTTPException=_HTTPException,
+        NotFound=type("NotFound", (_HTTPException,), {}),
+        Forbidden=type("Forbidden", (_HTTPException,), {}),
+    )
+    _module(
+        "lavalink", LavalinkEvents=_LavalinkEvents, Player=object, get_player=_get_player,
+        register_event_listener=lambda coro: None, unregister_event_listener=lambda coro: None,
+    )
+    _module("red_commons")
+    _module("red_commons.logging", getLogger=lambda name: _NullLog())
+    _module("redbot")
+    commands = _module(
+        "redbot.core.commands", Cog=_Cog, Context=object, command=lambda **kw: _Command,
+        group=lambda **kw: _Command, guild_only=_passthrough, is_owner=_passthrough,
+        bot_has_permissions=_passthrough, admin_or_permissions=_passthrough,
+    )
+    _module("redbot.core", commands=commands, Config=_FakeConfig)
+    _module("redbot.core.bot", Red=object)
+    _module("redbot.core.data_manager", cog_data_path=lambda cog: Path("."))
+    _module(
+        "redbot.core.i18n", Translator=lambda name, path: (lambda text: text),
+        cog_i18n=lambda translator: (lambda cls: cls),
+    )
+    _module("redbot.core.utils")
+    _module(
+        "redbot.core.utils.chat_formatting", box=str, humanize_number=str,
+        pagify=lambda text, **kwargs: [text],
+    )
+
+
+class _NullLog:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _FakeValue:
+    def __init__(self, value):
+        self.value = value
+
+    async def __call__(self):
+        return self.value
+
+    async def set(self, value):
+        self.value = value
+
+    async def clear(self):
+        self.value = None
+
+
+class _FakeGroup:
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        return _FakeValue(self._data.get(name))
+
+    async def all(self):
+        return dict(self._data)
+
+
+class _FakeConfig:
+    def __init__(self, guild_defaults=None):
+        self._guild_defaults = guild_defaults or {}
+        self._global = {}
+
+    @classmethod
+    def get_conf(cls, cog, identifier, force_registration=False):
+        return cls()
+
+    def register_global(self, **defaults):
+        self._global.update(defaults)
+
+    def register_guild(self, **defaults):
+        self._guild_defaults.update(defaults)
+
+    def guild(self, guild):
+        return _FakeGroup(self._guild_defaults)
+
+    def guild_from_id(self, guild_id):
+        return _FakeGroup(self._guild_defaults)
+
+    async def all(self):
+        return dict(self._global)
+
+    async def all_guilds(self):
+        return {}
+
+    def __getattr__(self, name):
+        return _FakeValue(self._global.get(name))
+
+
+# ---------------------------------------------------------------------------
+# Fake Red / Lavalink objects
+# ---------------------------------------------------------------------------
+
+
+class FakeMember:
+    def __init__(self, id, name):
+        self.id = id
+        self.name = self.display_name = name
+        self.mention = f"<@{id}>"
+
+
+class FakeGuild:
+    def __init__(self, id):
+        self.id = id
+        self.name = "Benchmark Guild"
+        self.icon = types.SimpleNamespace(url="https://cdn.example/icon.png")
+        self.members = [FakeMember(1000 + i, f"user{i}") for i in range(50)]
+        self._members = {m.id: m for m in self.members}
+        self.me = FakeMember(1, "bot")
+
+    def get_member(self, id):
+        return self._members.get(id)
+
+
+class FakeTrack:
+    def __init__(self, i, requester):
+        self.title = f"Track number {i} with a reasonably long title"
+        self.author = f"Artist {i % 97}"
+        self.uri = f"https://www.youtube.com/watch?v=bench{i:06d}"
+        self.identifier = f"bench{i:06d}"
+        self.track_identifier = f"QAAA{i:012d}"
+        self.length = 180000 + i
+        self.position = 0
+        self.is_stream = False
+        self.seekable = True
+        self.thumbnail = f"https://img.youtube.com/vi/bench{i:06d}/mqdefault.jpg"
+        self.requester = requester
+        self.extras = {}
+
+
+class FakePlayer:
+    def __init__(self, guild, size):
+        requester = guild.members[0]
+        self.guild = guild
+        self.current = FakeTrack(-1, requester)
+        self.queue = [FakeTrack(i, requester) for i in range(size)]
+        self.paused = False
+        self.position = 0
+        self.volume = 100
+        self.channel_id = 1
+
+
+class FakeAudioCog:
+    local_folder_current_path = Path("/music")
+
+    def __init__(self):
+        self.config = _FakeConfig(
+            {"repeat": False, "shuffle": False, "auto_play": True, "volume": 100}
+        )
+
+    async def get_track_description(self, track, local_folder):
+        return f"**{track.author}** - [{track.title}]({track.uri})"
+
+    @staticmethod
+    def format_time(ms):
+        seconds = ms // 1000
+        return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class FakeMessage:
+    id = 42
+    edits = 0
+
+    async def edit(self, **payload):
+        self.edits += 1
+
+
+class FakeBot:
+    def __init__(self, loop):
+        self.loop = loop
+        self.user = FakeMember(1, "bot")
+        self.audio = FakeAudioCog()
+
+    async def wait_until_ready(self):
+        return None
+
+    def get_cog(self, name):
+        return self.audio if name == "Audio" else None
+
+    def get_guild(self, guild_id):
+        return None
+
+    def get_channel(self, channel_id):
+        return None
+
+    def is_closed(self):
+        return False
+
+    def add_view(self, view):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+
+class Bench:
+    def __init__(self, module, loop):
+        self.module = module
+        self.loop = loop
+        self.cog = module.EnhancedAudio(FakeBot(loop))
+        self.cog.original_cog = self.cog.bot.audio
+        # Keep the embed payloads in memory instead of scheduling edits
+        self.cog.edit_coalescer.submit = lambda message, **payload: None
+
+    def setup(self, size):
+        guild = FakeGuild(size)
+        _players[guild.id] = FakePlayer(guild, size)
+        ctx = types.SimpleNamespace(
+            guild=guild, author=guild.members[0], me=guild.me, bot=self.cog.bot,
+            channel=types.SimpleNamespace(id=5),
+        )
+        view = self.module.EnhancedAudioView(self.cog, ctx)
+        view.message = FakeMessage()
+        return ctx, view
+
+    def cases(self):
+        for size in QUEUE_SIZES:
+            ctx, view = self.setup(size)
+            last_page = self.cog.queue_page_count(_players[ctx.guild.id]) - 1
+
+            async def first_page_cold(ctx=ctx):
+                self.cog.track_descriptions.clear()
+                await self.cog.create_queue_page(ctx, 0)
+
+            async def last_page_warm(ctx=ctx, last_page=last_page):
+                await self.cog.create_queue_page(ctx, last_page)
+
+            queue_view = self.module.EnhancedQueueView(self.cog, ctx)
+            player = _players[ctx.guild.id]
+
+            async def queue_view_after_skip(queue_view=queue_view, player=player):
+                # Skip one track and enqueue it again, so the queue keeps its length
+                player.queue.append(player.queue.pop(0))
+                await queue_view.show_page(1, prefetch=False)
+
+            async def now_playing_build(view=view, guild_id=ctx.guild.id):
+                self.cog.now_playing_renderer.forget(guild_id)
+                await view.update_now_playing()
+
+            async def state_unchanged(view=view):
+                await view.update_now_playing()
+
+            yield f"queue_first_page_cold[{size}]", first_page_cold
+            yield f"queue_last_page_warm[{size}]", last_page_warm
+            yield f"queue_view_after_skip[{size}]", queue_view_after_skip
+            yield f"now_playing_build[{size}]", now_playing_build
+            yield f"now_playing_unchanged[{size}]", state_unchanged
+
+    def measure(self, func, repeat, min_time):
+        async def run(number):
+            started = time.perf_counter()
+            for _ in range(number):
+                await func()
+            return time.perf_counter() - started
+
+        # Warm up caches, then size the inner loop so a round takes at least min_time
+        self.loop.run_until_complete(run(1))
+        number = 1
+        while True:
+            elapsed = self.loop.run_until_complete(run(number))
+            if elapsed >= min_time or number >= 1_000_000:
+                break
+            number *= 2 if elapsed < min_time / 4 else 1 + int(min_time / max(elapsed, 1e-9))
+        timings = []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                timings.append(self.loop.run_until_complete(run(number)) / number)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        median = statistics.median(timings)
+        noise = statistics.median(abs(t - median) for t in timings) / median
+        return min(timings), median, noise
+
+
+def load_module():
+    install_stubs()
+    sys.path.insert(0, str(REPO_ROOT))
+    return importlib.import_module("enhanced_audio.enhanced_audio")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=15, help="timed rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per round")
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--save", type=Path, help="write results to a JSON baseline file")
+    parser.add_argument("--compare", type=Path, help="compare against a JSON baseline file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown before flagging a regression"
+    )
+    args = parser.parse_args(argv)
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    async def make_bench():
+        return Bench(load_module(), loop)
+
+    bench = loop.run_until_complete(make_bench())
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+    results = {}
+    regressions = []
+    print(f"{'benchmark':<36} {'best':>12} {'median':>12} {'noise':>8} {'vs baseline':>12}")
+    for name, func in bench.cases():
+        if args.filter not in name:
+            continue
+        best, median, noise = bench.measure(func, args.repeat, args.min_time)
+        results[name] = {"median": median, "noise": noise}
+        delta = ""
+        if name in baseline:
+            reference = baseline[name]
+            if not isinstance(reference, dict):  # Baselines saved before medians were kept
+                reference = {"median": reference, "noise": 0.0}
+            change = median / reference["median"] - 1
+            delta = f"{change:+.1%}"
+            if change > args.threshold + NOISE_MARGIN * max(noise, reference["noise"]):
+                regressions.append((name, change))
+                delta += " !"
+        print(f"{name:<36} {best * 1e6:>10.1f}us {median * 1e6:>10.1f}us {noise:>7.1%} {delta:>12}")
+    loop.run_until_complete(bench.cog.cog_unload())
+    loop.run_until_complete(asyncio.sleep(0))
+    loop.close()
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for name, change in regressions:
+            print(f"  {name}: {change:+.1%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
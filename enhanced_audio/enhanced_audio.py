@@ -7,55 +7,1154 @@ Author: duduws
 """
 
 __red_end_user_data_statement__ = (
-    "This cog stores per-guild music settings (such as repeat and shuffle state) and last activity timestamps for the purpose of music playback and auto-disconnect. No personal user data is stored except for user IDs as requesters of tracks, which are only used for display in the Now Playing embed."
+    "This cog stores per-guild music settings (such as repeat and shuffle state), the location of the Now Playing message and last activity timestamps for the purpose of music playback and auto-disconnect. The user ID of the member who started each server's Now Playing controller is stored so its buttons keep their owner across restarts. User IDs of track requesters are only kept in memory for display in the Now Playing embed."
 )
 
 import asyncio
 import contextlib
+import functools
+import heapq
+import itertools
+import json
+import logging
 import math
+import re
+import sqlite3
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from datetime import timedelta
+from collections import OrderedDict, defaultdict, deque
 from pathlib import Path
-from typing import List, MutableMapping, Optional, Union, Dict
+from typing import Awaitable, Callable, Hashable, List, MutableMapping, NamedTuple, Optional, Union, Dict
 
 import discord
 import lavalink
 from discord import app_commands
+from discord.ext import tasks
 from red_commons.logging import getLogger
 
 from redbot.core import commands, Config
+from redbot.core.data_manager import cog_data_path
 from redbot.core.i18n import Translator, cog_i18n
-from redbot.core.utils.chat_formatting import humanize_number
+from redbot.core.utils.chat_formatting import box, humanize_number, pagify
+
+try:
+    from redbot.cogs.audio.apis.playlist_interface import get_all_playlist
+    from redbot.cogs.audio.utils import PlaylistScope
+except ImportError:  # Audio internals moved; only playlist URLs can be played then
+    get_all_playlist = PlaylistScope = None
+try:
+    from redbot.cogs.audio.audio_dataclasses import Query
+except ImportError:  # Audio internals moved; every play then goes through command_play
+    Query = None
 
 log = getLogger("red.enhanced_audio.enhanced_audio")
 _ = Translator("EnhancedAudio", Path(__file__))
 
+REFRESH_INTERVAL = 600  # Slowest fallback poll; track events normally trigger refreshes
+MIN_REFRESH_INTERVAL = 10  # Fastest fallback poll, used while the refresh budget allows it
+LIVE_PROGRESS_INTERVAL = 30  # Controllers refreshed at least this often show a progress bar
+REFRESH_BUDGET = 60  # Default background controller edits per minute, across all guilds
+MAX_REFRESH_BACKOFF = 16  # Largest factor the refresh interval is stretched by after 429s
+REFRESH_BACKOFF_DECAY = 60  # Seconds without a 429 before the back-off factor is halved
+CONTROLLER_TIMEOUT = REFRESH_INTERVAL * 2  # Outlives the gap between two refreshes
+EVENT_REFRESH_DELAY = 1.0  # Lets a track end and the next track start share one refresh
+CONTROLLER_EVENTS = (
+    lavalink.LavalinkEvents.TRACK_START,
+    lavalink.LavalinkEvents.TRACK_END,
+    lavalink.LavalinkEvents.TRACK_EXCEPTION,
+    lavalink.LavalinkEvents.QUEUE_END,
+)
+INACTIVITY_TIMEOUT = 60  # Seconds without activity before an idle player is disconnected
+SETTINGS_TTL = 60  # Seconds before a cached Audio guild snapshot is re-read from Config
+TRACK_DESCRIPTION_CACHE_SIZE = 4096
+QUEUE_PAGE_SIZE = 10  # Tracks per queue page
+QUEUE_PREFETCH_PAGES = 1  # Pages rendered ahead of and behind the visible one
+QUEUE_SHIFT_LOOKAHEAD = 8  # Most tracks a queue view recognises as skipped between two renders
+QUERY_CACHE_SIZE = 1024  # Resolved queries kept in memory
+QUERY_CACHE_TTL = 6 * 3600  # Seconds a resolved query is reused, in memory and on disk
+PLAYLIST_CHUNK_SIZE = 50  # Playlist tracks enqueued between two yields to the event loop
+MAX_QUEUE_LENGTH = 10000  # The Audio cog refuses to queue beyond this
+OUTBOUND_CONCURRENCY = 4  # Queued REST calls the cog keeps in flight at once
+OUTBOUND_PRESSURE_DEPTH = 20  # Waiting calls at or above which cleanup is deferred
+OUTBOUND_SHED_DEPTH = 200  # Waiting calls at or above which new cleanup calls are refused
+INTERACTION_GRACE = 3.0  # Longest a guild's queued calls are held back for its running interactions
+CLEANUP_MAX_DEFER = 30.0  # Longest a channel's notification cleanup is deferred under pressure
+EDIT_COALESCE_WINDOW = 1.5  # Seconds during which edits to one message are merged
+NOTIFICATION_INDEX_SIZE = 200  # Tracked notifications per channel that trigger an immediate flush
+BULK_DELETE_LIMIT = 100  # Discord accepts at most 100 messages per bulk delete
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+AUDIO_NOTIFICATION_TITLES = (
+    "track paused", "track resumed", "volume", "track enqueued", "track added"
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_EXPORT_INTERVAL = 60  # Seconds between writes of the Prometheus metrics file
+API_COUNTERS = (
+    "message_edit", "message_delete", "message_bulk_delete", "history_fetch",
+    "config_read", "config_write", "audio_command", "lavalink_call",
+)
+
+
+def is_audio_notification(message: discord.Message) -> bool:
+    """Whether a message is one of the Audio cog's transient notification embeds."""
+    if not message.embeds:
+        return False
+    title = message.embeds[0].title
+    return bool(title) and any(t in title.lower() for t in AUDIO_NOTIFICATION_TITLES)
+
+
+class MetricsRegistry:
+    """
+    In-process latency histograms and call counters for the cog.
+
+    Histograms are keyed by a kind (``slash``, ``button``, ``refresh``) and a name; counters
+    by call type. Everything can be rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counters: Dict[str, int] = defaultdict(int)
+        for name in API_COUNTERS:
+            self.counters[name] = 0
+        self._histograms: Dict[tuple, list] = {}  # (kind, name) -> [bucket counts..., count, sum]
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    def observe(self, kind: str, name: str, seconds: float):
+        histogram = self._histograms.get((kind, name))
+        if histogram is None:
+            histogram = self._histograms[(kind, name)] = [0] * (len(self.buckets) + 2)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                histogram[i] += 1
+                break
+        histogram[-2] += 1
+        histogram[-1] += seconds
+
+    def quantile(self, kind: str, name: str, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket it falls in."""
+        histogram = self._histograms.get((kind, name))
+        if not histogram or not histogram[-2]:
+            return None
+        target = q * histogram[-2]
+        seen = 0
+        for i, bound in enumerate(self.buckets):
+            seen += histogram[i]
+            if seen >= target:
+                return bound
+        return math.inf
+
+    def summary(self) -> List[tuple]:
+        """(kind, name, count, mean, p50, p95) for every recorded histogram."""
+        rows = []
+        for (kind, name), histogram in sorted(self._histograms.items()):
+            count = histogram[-2]
+            rows.append((
+                kind, name, count, histogram[-1] / count if count else 0.0,
+                self.quantile(kind, name, 0.5), self.quantile(kind, name, 0.95),
+            ))
+        return rows
+
+    def to_prometheus(self, gauges: Optional[Dict[str, float]] = None) -> str:
+        lines = [
+            "# HELP enhanced_audio_latency_seconds Latency of slash commands, buttons and refreshes.",
+            "# TYPE enhanced_audio_latency_seconds histogram",
+        ]
+        for (kind, name), histogram in sorted(self._histograms.items()):
+            labels = f'kind="{kind}",name="{name}"'
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += histogram[i]
+                lines.append(f'enhanced_audio_latency_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'enhanced_audio_latency_seconds_bucket{{{labels},le="+Inf"}} {histogram[-2]}')
+            lines.append(f"enhanced_audio_latency_seconds_sum{{{labels}}} {histogram[-1]}")
+            lines.append(f"enhanced_audio_latency_seconds_count{{{labels}}} {histogram[-2]}")
+        lines.append("# HELP enhanced_audio_calls_total Discord API, Config and Lavalink calls made by the cog.")
+        lines.append("# TYPE enhanced_audio_calls_total counter")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'enhanced_audio_calls_total{{call="{name}"}} {value}')
+        if gauges:
+            lines.append("# HELP enhanced_audio_state Current size of the cog's caches, queues and registries.")
+            lines.append("# TYPE enhanced_audio_state gauge")
+            for name, value in sorted(gauges.items()):
+                lines.append(f'enhanced_audio_state{{name="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+def timed(kind: str, name: str):
+    """Record the latency of a cog or view coroutine in the cog's metrics registry."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cog = getattr(self, "cog", self)
+            started = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                cog.metrics.observe(kind, name, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+class DeadlineScheduler:
+    """
+    Drives per-key deadlines from a single task and a min-heap.
+
+    Keys can be scheduled, rescheduled or cancelled at any time. Replaced entries are left
+    in the heap and skipped when popped, so every operation is O(log n) and the task only
+    wakes up for the earliest live deadline. Keys that fall due together are handed to
+    ``callback`` as one list.
+    """
+
+    def __init__(self, callback: Callable[[List[Hashable]], Awaitable[None]], *, name: str = "scheduler"):
+        self.name = name
+        self._callback = callback
+        self._heap = []
+        self._entries = {}  # key -> (deadline, seq, interval)
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._dispatching = set()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for task in list(self._dispatching):
+            task.cancel()
+        self._heap.clear()
+        self._entries.clear()
+
+    def schedule(self, key: Hashable, delay: float, interval: Optional[float] = None) -> int:
+        """Fire ``key`` after ``delay`` seconds, then every ``interval`` seconds if given."""
+        seq = self._push(key, time.monotonic() + delay, interval)
+        if self._heap[0][1] == seq:
+            self._wakeup.set()
+        return seq
+
+    def reschedule(self, key: Hashable, delay: float, *, only_earlier: bool = False) -> Optional[int]:
+        """Move the deadline of an already scheduled key, keeping its interval."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if only_earlier and entry[0] <= time.monotonic() + delay:
+            return entry[1]
+        return self.schedule(key, delay, entry[2])
+
+    def cancel(self, key: Hashable) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def _push(self, key, deadline, interval):
+        seq = next(self._counter)
+        self._entries[key] = (deadline, seq, interval)
+        heapq.heappush(self._heap, (deadline, seq, key))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            # Too many stale entries, rebuild from the live ones
+            self._heap = [(d, q, k) for k, (d, q, _i) in self._entries.items()]
+            heapq.heapify(self._heap)
+        return seq
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                _deadline, seq, key = heapq.heappop(self._heap)
+                entry = self._entries.get(key)
+                if entry is None or entry[1] != seq:
+                    continue
+                due.append(key)
+                if entry[2] is None:
+                    del self._entries[key]
+                else:
+                    self._push(key, now + entry[2], entry[2])
+            if due:
+                task = asyncio.get_event_loop().create_task(self._dispatch(due))
+                self._dispatching.add(task)
+                task.add_done_callback(self._dispatching.discard)
+            timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _dispatch(self, keys):
+        try:
+            await self._callback(keys)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.error(f"Error in {self.name} callback: {e}")
+
+
+class RefreshBudget:
+    """
+    Spreads a global budget of background controller edits over the guilds with a controller.
+
+    Refreshes pulled forward by track events in the last minute are spent first; the fallback
+    refresh interval is the number of active controllers divided by what is left of the budget,
+    raised to a guild's own interval if it set a slower one, clamped to [MIN_REFRESH_INTERVAL, REFRESH_INTERVAL] and stretched by a back-off factor.
+    The factor doubles whenever Discord answers with a 429 and halves again after every
+    REFRESH_BACKOFF_DECAY seconds without one.
+
+    The clamp is a ceiling on how far the budget is honoured: with more than ``budget * 10``
+    active controllers, polling each one every REFRESH_INTERVAL already exceeds it.
+    """
+
+    def __init__(self, edits_per_minute: float = REFRESH_BUDGET):
+        self.edits_per_minute = edits_per_minute
+        self.backoff = 1.0
+        self.rate_limits = 0
+        self._backoff_since = 0.0
+        self._event_refreshes: deque = deque()  # When event-driven refreshes were scheduled
+
+    def spend(self):
+        """Record a refresh pulled forward by a track event."""
+        self._event_refreshes.append(time.monotonic())
+
+    def event_refreshes(self) -> int:
+        """Event-driven refreshes in the last minute."""
+        horizon = time.monotonic() - 60
+        while self._event_refreshes and self._event_refreshes[0] < horizon:
+            self._event_refreshes.popleft()
+        return len(self._event_refreshes)
+
+    def interval(self, active: int, override: Optional[float] = None) -> float:
+        if self.backoff > 1:
+            halvings = int((time.monotonic() - self._backoff_since) // REFRESH_BACKOFF_DECAY)
+            if halvings:
+                self.backoff = max(1.0, self.backoff / 2 ** halvings)
+                self._backoff_since += halvings * REFRESH_BACKOFF_DECAY
+        base = active * 60 / max(1.0, self.edits_per_minute - self.event_refreshes())
+        if override is not None:
+            # A guild's own interval may only slow its controller down, never outspend the budget
+            base = max(base, override)
+        return min(REFRESH_INTERVAL, max(MIN_REFRESH_INTERVAL, base) * self.backoff)
+
+    def rate_limited(self):
+        self.rate_limits += 1
+        self.backoff = min(MAX_REFRESH_BACKOFF, self.backoff * 2)
+        self._backoff_since = time.monotonic()
+
+
+class RateLimitWatcher(logging.Handler):
+    """
+    Reports the 429s discord.py handles internally, which never reach our own code.
+
+    discord.py retries rate-limited requests by itself and only logs a warning, so this handler
+    is attached to its HTTP logger while the cog is loaded.
+    """
+
+    def __init__(self, budget: RefreshBudget):
+        super().__init__(logging.WARNING)
+        self.budget = budget
+
+    def emit(self, record: logging.LogRecord):
+        if "429" in str(record.msg) or "rate limit" in str(record.msg).lower():
+            self.budget.rate_limited()
+
+
+class GuildSession:
+    """
+    Compact per-guild controller record.
+
+    Holds IDs rather than ``discord.Message`` objects; a PartialMessage is created from them
+    only when an API call needs one.
+    """
+
+    __slots__ = (
+        "channel_id", "message_id", "owner_id", "last_activity", "view", "refresh_handle", "refresh_interval"
+    )
+
+    def __init__(
+        self, channel_id: Optional[int] = None, message_id: Optional[int] = None, owner_id: Optional[int] = None
+    ):
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.owner_id = owner_id  # Member who started the controller
+        self.last_activity: Optional[float] = None
+        self.view: Optional["EnhancedAudioView"] = None
+        self.refresh_handle: Optional[int] = None  # Sequence number of the refresh_scheduler entry
+        self.refresh_interval: Optional[float] = None  # Interval that entry was last scheduled with
+
+    def is_empty(self) -> bool:
+        return self.message_id is None and self.view is None and self.last_activity is None
+
+
+class PlaylistLoad:
+    """Progress of a playlist being enqueued in the background."""
+
+    __slots__ = ("name", "total", "enqueued", "task")
+
+    def __init__(self, name: str, total: int):
+        self.name = name
+        self.total = total
+        self.enqueued = 0
+        self.task: Optional[asyncio.Task] = None
+
+
+class ControlAction:
+    __slots__ = ("kind", "ctx", "member", "amount", "future")
+
+    def __init__(self, kind: str, ctx, member, amount: int, future: asyncio.Future):
+        self.kind = kind
+        self.ctx = ctx
+        self.member = member
+        self.amount = amount
+        self.future = future
+
+
+class GuildControlActor:
+    """
+    Applies a guild's control actions one at a time, in the order they were submitted.
+
+    Actions waiting behind the running one are merged when they are the same kind from the same
+    member: volume deltas are summed and skips become a single skip-N. Absolute volume changes
+    (``set_volume``) are never merged. Every merged submitter receives the result of the
+    combined call. The worker task only lives while actions are queued.
+    """
+
+    MERGEABLE = frozenset({"volume", "skip"})
+
+    def __init__(self, cog):
+        self.cog = cog
+        self.merged = 0
+        self._queue: deque = deque()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def submit(self, kind: str, ctx, member, amount: int = 1) -> asyncio.Future:
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self._queue.append(ControlAction(kind, ctx, member, amount, future))
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return future
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+        for action in self._queue:
+            action.future.cancel()
+        self._queue.clear()
+
+    def _take_batch(self) -> List[ControlAction]:
+        batch = [self._queue.popleft()]
+        first = batch[0]
+        if first.kind in self.MERGEABLE:
+            while (
+                self._queue
+                and self._queue[0].kind == first.kind
+                and self._queue[0].member == first.member
+            ):
+                batch.append(self._queue.popleft())
+            self.merged += len(batch) - 1
+        return batch
+
+    async def _run(self):
+        while self._queue:
+            batch = self._take_batch()
+            first = batch[0]
+            try:
+                result = await self.cog.apply_control(
+                    first.kind, first.ctx, first.member, sum(a.amount for a in batch)
+                )
+            except asyncio.CancelledError:
+                for action in batch:
+                    action.future.cancel()
+                raise
+            except Exception as e:
+                for action in batch:
+                    if not action.future.done():
+                        action.future.set_exception(e)
+            else:
+                for action in batch:
+                    if not action.future.done():
+                        action.future.set_result(result)
+
+
+class AudioSettingsCache:
+    """
+    Write-through, per-guild snapshot of the Audio cog settings the controller displays.
+
+    Our own buttons and slash commands update or invalidate the snapshot when they change
+    a setting. Snapshots older than ``ttl`` seconds are re-read from the Audio cog's Config,
+    which reconciles changes made through other commands. Permission checks pass ``fresh`` so
+    a setting changed through the Audio cog applies at once.
+    """
+
+    FIELDS = (
+        "repeat", "shuffle", "auto_play", "volume", "max_volume", "dj_enabled", "vote_enabled",
+        "jukebox", "maxlength", "url_keyword_blacklist", "url_keyword_whitelist",
+    )
+
+    def __init__(self, metrics: MetricsRegistry, ttl: float = SETTINGS_TTL):
+        self.metrics = metrics
+        self.ttl = ttl
+        self._snapshots: Dict[int, tuple] = {}  # guild_id -> (fetched_at, settings)
+
+    async def get(self, config: Config, guild: discord.Guild, *, fresh: bool = False) -> dict:
+        cached = self._snapshots.get(guild.id)
+        if cached and not fresh and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        self.metrics.count("config_read")
+        guild_data = await config.guild(guild).all()
+        settings = {field: guild_data.get(field) for field in self.FIELDS}
+        self._snapshots[guild.id] = (time.monotonic(), settings)
+        return settings
+
+    def update(self, guild_id: int, **values):
+        cached = self._snapshots.get(guild_id)
+        if cached:
+            cached[1].update(values)
+
+    def invalidate(self, guild_id: int):
+        self._snapshots.pop(guild_id, None)
+
+
+class TrackDescriptionCache:
+    """
+    Bounded LRU of rendered track descriptions.
+
+    Entries are keyed by the track identifier and the local folder path, the two inputs
+    the Audio cog uses to describe a track.
+    """
+
+    def __init__(self, maxsize: int = TRACK_DESCRIPTION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(track, local_folder) -> Optional[tuple]:
+        identifier = getattr(track, "track_identifier", None) or getattr(track, "uri", None)
+        if not identifier:
+            return None
+        return identifier, str(local_folder)
+
+    def get(self, key: tuple) -> Optional[str]:
+        try:
+            description = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return description
+
+    def put(self, key: tuple, description: str):
+        self._entries[key] = description
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class QueryResolutionCache:
+    """
+    Two-tier cache of Lavalink ``loadtracks`` responses, keyed by normalized query.
+
+    The in-memory LRU answers repeated queries without I/O; misses fall through to a SQLite
+    database under the cog's data folder, which outlives reloads. Both tiers expire entries
+    after ``ttl`` seconds. SQLite runs on a single worker thread so the event loop never blocks.
+    """
+
+    def __init__(self, path: Path, maxsize: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, raw)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enhanced_audio_cache")
+        self._db: Optional[sqlite3.Connection] = None  # Only touched on the executor thread once open
+        self._disk = False  # Whether the database is open and still accepting reads and writes
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+    @staticmethod
+    def normalize(lavalink_query: str, is_search: bool) -> str:
+        """
+        Cache key for a query as the Audio cog would send it to Lavalink.
+
+        Searches keep their source prefix and are whitespace-collapsed and lower-cased; anything
+        else (URLs with case-sensitive IDs) is used verbatim. The key is never sent to Lavalink.
+        """
+        if not is_search:
+            return lavalink_query
+        source, _, terms = lavalink_query.partition(":")
+        return f"{source}:" + re.sub(r"\s+", " ", terms.strip()).lower()
+
+    async def _run(self, func, *args):
+        return await asyncio.get_event_loop().run_in_executor(self._executor, func, *args)
+
+    def _open(self):
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS queries (key TEXT PRIMARY KEY, raw TEXT, expires_at REAL)"
+        )
+        self._db.execute("DELETE FROM queries WHERE expires_at < ?", (time.time(),))
+        self._db.commit()
+
+    def _read(self, key: str) -> Optional[tuple]:
+        if self._db is None:
+            return None
+        return self._db.execute(
+            "SELECT expires_at, raw FROM queries WHERE key = ? AND expires_at >= ?", (key, time.time())
+        ).fetchone()
+
+    def _write(self, key: str, raw: str, expires_at: float):
+        if self._db is None:
+            return
+        self._db.execute("REPLACE INTO queries VALUES (?, ?, ?)", (key, raw, expires_at))
+        self._db.commit()
+
+    def _close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key: str, expires_at: float, raw: dict):
+        self._entries[key] = (expires_at, raw)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def open(self):
+        await self._run(self._open)
+        self._disk = True
+
+    async def get(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] >= time.time():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry[1]
+            del self._entries[key]
+        row = await self._run(self._read, key) if self._disk else None
+        if row is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        raw = json.loads(row[1])
+        self._remember(key, row[0], raw)
+        return raw
+
+    async def put(self, key: str, raw: dict):
+        expires_at = time.time() + self.ttl
+        self._remember(key, expires_at, raw)
+        if self._disk:
+            await self._run(self._write, key, json.dumps(raw), expires_at)
+
+    def close(self):
+        """Close the database after the reads and writes already queued on its thread."""
+        self._entries.clear()
+        self._disk = False
+        self._executor.submit(self._close)
+        self._executor.shutdown(wait=False)
+
+
+class OutboundQueue:
+    """
+    Orders the cog's background REST calls by priority class.
+
+    Calls are queued as CONTROLLER (Now Playing edits) or CLEANUP (notification and controller
+    deletes) and at most ``concurrency`` of them are in flight. Interaction responses never go
+    through the queue; their handlers await them directly inside ``interaction``, and while one
+    is running in a guild, that guild's queued calls are held back for up to INTERACTION_GRACE
+    seconds. Other guilds' calls are not affected. Callers check ``pressured`` to defer cleanup, and
+    sheddable CLEANUP calls submitted once OUTBOUND_SHED_DEPTH calls are waiting fail with
+    ``asyncio.QueueFull``.
+    """
+
+    CONTROLLER, CLEANUP = range(2)
+    CLASSES = ("controller", "cleanup")
+
+    def __init__(self, metrics: MetricsRegistry, concurrency: int = OUTBOUND_CONCURRENCY):
+        self.metrics = metrics
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.depth = [0] * len(self.CLASSES)
+        self.shed = 0
+        self._heap = []  # (priority, seq, queued_at, guild_id, future, call)
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._busy_guilds: Dict[Optional[int], int] = defaultdict(int)  # guild_id -> interactions
+        self._workers: List[asyncio.Task] = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    @property
+    def interactions(self) -> int:
+        return sum(self._busy_guilds.values())
+
+    def start(self):
+        loop = asyncio.get_event_loop()
+        while len(self._workers) < self.concurrency:
+            self._workers.append(loop.create_task(self._work()))
+
+    def stop(self):
+        for task in self._workers:
+            task.cancel()
+        self._workers.clear()
+        for entry in self._heap:
+            entry[4].cancel()
+        self._heap.clear()
+        self.depth = [0] * len(self.CLASSES)
+
+    @contextlib.contextmanager
+    def interaction(self, guild_id: Optional[int]):
+        """Hold back ``guild_id``'s queued calls while an interaction handler runs."""
+        self._busy_guilds[guild_id] += 1
+        try:
+            yield
+        finally:
+            self._busy_guilds[guild_id] -= 1
+            if not self._busy_guilds[guild_id]:
+                del self._busy_guilds[guild_id]
+                self._wakeup.set()
+
+    def pressured(self, priority: int) -> bool:
+        """Whether calls of ``priority`` would wait behind a backlog and are better deferred."""
+        return sum(self.depth[: priority + 1]) >= OUTBOUND_PRESSURE_DEPTH
+
+    def submit(
+        self, priority: int, guild_id: Optional[int], func: Callable[..., Awaitable], *args,
+        shed: bool = True, **kwargs
+    ) -> asyncio.Future:
+        """Queue ``func(*args, **kwargs)`` for ``guild_id``; the returned future resolves to its result."""
+        future = asyncio.get_event_loop().create_future()
+        if shed and priority == self.CLEANUP and len(self._heap) >= OUTBOUND_SHED_DEPTH:
+            self.shed += 1
+            future.set_exception(asyncio.QueueFull())
+            return future
+        call = functools.partial(func, *args, **kwargs)
+        heapq.heappush(self._heap, (priority, next(self._counter), time.monotonic(), guild_id, future, call))
+        self.depth[priority] += 1
+        self._wakeup.set()
+        return future
+
+    def _held(self, entry: tuple, now: float) -> bool:
+        return entry[3] in self._busy_guilds and now - entry[2] < INTERACTION_GRACE
+
+    def _pop(self) -> Union[tuple, float, None]:
+        """
+        Pop the most important call not held back by an interaction in its guild.
+
+        Returns the number of seconds until the first held call is released when every queued
+        call is held, or None when the queue is empty.
+        """
+        if not self._heap:
+            return None
+        now = time.monotonic()
+        if not self._held(self._heap[0], now):
+            return heapq.heappop(self._heap)
+        ready = [i for i, entry in enumerate(self._heap) if not self._held(entry, now)]
+        if not ready:
+            return min(entry[2] for entry in self._heap) + INTERACTION_GRACE - now
+        index = min(ready, key=lambda i: self._heap[i][:2])
+        entry = self._heap[index]
+        self._heap[index] = self._heap[-1]
+        self._heap.pop()
+        heapq.heapify(self._heap)
+        return entry
+
+    async def _work(self):
+        while True:
+            entry = self._pop()
+            if not isinstance(entry, tuple):
+                self._wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), entry)
+                continue
+            priority, _seq, queued_at, _guild_id, future, call = entry
+            self.depth[priority] -= 1
+            if future.cancelled():
+                continue
+            self.metrics.observe("outbound", self.CLASSES[priority], time.monotonic() - queued_at)
+            self.in_flight += 1
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self.in_flight -= 1
+
+
+class MessageEditCoalescer:
+    """
+    Collapses bursts of edits to the same message into a single ``message.edit``.
+
+    The first edit after a quiet period goes out immediately. Edits submitted within
+    ``window`` seconds of the last one are merged, and only the latest payload is sent when
+    the window closes. A payload that is byte-identical to the last one sent is dropped.
+    ``on_gone`` runs when the message can no longer be edited, ``on_failed`` when an edit fails
+    for any other reason. A ``final`` edit is the last one a message gets, so nothing about the
+    message is kept once it has been flushed.
+    """
+
+    def __init__(
+        self, metrics: MetricsRegistry, outbound: OutboundQueue, window: float = EDIT_COALESCE_WINDOW
+    ):
+        self.metrics = metrics
+        self.outbound = outbound
+        self.window = window
+        self.sent = 0
+        self.skipped = 0
+        self.coalesced = 0
+        self._pending: Dict[int, tuple] = {}  # message_id -> (message, payload, on_gone, on_failed, final)
+        self._flush_tasks: Dict[int, asyncio.Task] = {}
+        self._last_sent: Dict[int, tuple] = {}  # message_id -> (sent_at, signature)
+
+    @staticmethod
+    def signature(payload: dict) -> bytes:
+        parts = {}
+        for key, value in payload.items():
+            if isinstance(value, discord.Embed):
+                value = value.to_dict()
+            elif isinstance(value, discord.ui.View):
+                value = value.to_components()
+            parts[key] = value
+        return json.dumps(parts, sort_keys=True, default=str).encode()
+
+    def submit(
+        self,
+        message: discord.abc.Snowflake,
+        *,
+        on_gone: Optional[Callable] = None,
+        on_failed: Optional[Callable] = None,
+        final: bool = False,
+        **payload,
+    ):
+        """Queue ``message.edit(**payload)``, replacing any edit still waiting for that message."""
+        message_id = message.id
+        if message_id in self._pending:
+            self.coalesced += 1
+        self._pending[message_id] = (message, payload, on_gone, on_failed, final)
+        if message_id in self._flush_tasks:
+            return
+        last = self._last_sent.get(message_id)
+        delay = 0 if last is None else max(0.0, last[0] + self.window - time.monotonic())
+        self._flush_tasks[message_id] = asyncio.get_event_loop().create_task(
+            self._flush_later(message_id, delay)
+        )
+
+    def __len__(self) -> int:
+        return len(self._flush_tasks)
+
+    def forget(self, message_id: int):
+        if message_id not in self._pending:
+            self._last_sent.pop(message_id, None)
+
+    def cancel_all(self):
+        for task in self._flush_tasks.values():
+            task.cancel()
+        self._flush_tasks.clear()
+        self._pending.clear()
+
+    async def _flush_later(self, message_id: int, delay: float):
+        final = False
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            message, payload, on_gone, on_failed, final = self._pending.pop(message_id)
+            signature = self.signature(payload)
+            last = self._last_sent.get(message_id)
+            if last is not None and last[1] == signature:
+                self.skipped += 1
+                return
+            try:
+                self.metrics.count("message_edit")
+                guild = getattr(message, "guild", None)
+                await self.outbound.submit(
+                    OutboundQueue.CONTROLLER, guild.id if guild else None, message.edit, **payload
+                )
+            except discord.NotFound:
+                if on_gone:
+                    on_gone()
+                return
+            except discord.HTTPException as e:
+                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                    log.debug("Invalid webhook token, stopping updates")
+                    if on_gone:
+                        on_gone()
+                else:
+                    log.error(f"Error editing message {message_id}: {e}")
+                    if on_failed:
+                        on_failed()
+                return
+            except Exception as e:
+                log.error(f"Error editing message {message_id}: {e}")
+                if on_failed:
+                    on_failed()
+                return
+            self.sent += 1
+            self._last_sent[message_id] = (time.monotonic(), signature)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.error(f"Error flushing edit for message {message_id}: {e}")
+        finally:
+            if final and message_id not in self._pending:
+                self._last_sent.pop(message_id, None)
+            if self._flush_tasks.get(message_id) is asyncio.current_task():
+                del self._flush_tasks[message_id]
+                if message_id in self._pending:
+                    # Edits arrived while this one was in flight
+                    self._flush_tasks[message_id] = asyncio.get_event_loop().create_task(
+                        self._flush_later(message_id, self.window)
+                    )
+
+
+class RequesterIndex:
+    """
+    Per-guild lookup of members by name and display name, used to resolve track requesters.
+
+    Requesters given as members or IDs are resolved straight from the member cache. For names,
+    a guild's index is built once in the background on the first lookup and then kept current
+    from member events. Names that match nobody are stored as misses, so the refresh path
+    never scans the member list.
+    """
+
+    BUILD_CHUNK = 1000  # Members indexed between yields to the event loop
+
+    def __init__(self):
+        self._names: Dict[int, Dict[str, Optional[int]]] = {}  # guild_id -> name -> member_id
+        self._building: Dict[int, asyncio.Task] = {}
+
+    def resolve(self, guild: discord.Guild, requester) -> Optional[discord.Member]:
+        requester_id = getattr(requester, "id", None)
+        if requester_id is None:
+            try:
+                requester_id = int(requester)
+            except (TypeError, ValueError):
+                pass
+        if requester_id is not None:
+            return guild.get_member(requester_id)
+        names = self._names.get(guild.id)
+        if names is None:
+            self._build_later(guild)
+            return None
+        name = str(requester)
+        if name not in names:
+            names[name] = None
+        member_id = names[name]
+        return guild.get_member(member_id) if member_id else None
+
+    def _build_later(self, guild: discord.Guild):
+        if guild.id in self._building:
+            return
+        task = asyncio.get_event_loop().create_task(self._build(guild))
+        self._building[guild.id] = task
+        task.add_done_callback(lambda _t: self._building.pop(guild.id, None))
+
+    async def _build(self, guild: discord.Guild):
+        names = {}
+        for i, member in enumerate(guild.members, start=1):
+            names.setdefault(member.name, member.id)
+            names.setdefault(member.display_name, member.id)
+            if i % self.BUILD_CHUNK == 0:
+                await asyncio.sleep(0)
+        self._names[guild.id] = names
+
+    def add(self, member: discord.Member):
+        names = self._names.get(member.guild.id)
+        if names is None:
+            return
+        for name in (member.name, member.display_name):
+            if not names.get(name):
+                names[name] = member.id
+
+    def remove(self, member: discord.Member, names: Optional[tuple] = None):
+        """Forget a member's names, or the given previous names of that member."""
+        index = self._names.get(member.guild.id)
+        if index is None:
+            return
+        for name in names or (member.name, member.display_name):
+            if index.get(name) == member.id:
+                del index[name]
+
+    def indexed_guilds(self) -> List[int]:
+        return list(self._names)
+
+    def drop(self, guild_id: int):
+        self._names.pop(guild_id, None)
+        task = self._building.pop(guild_id, None)
+        if task:
+            task.cancel()
+
+    def clear(self):
+        for guild_id in list(self._building):
+            self.drop(guild_id)
+        self._names.clear()
+
+
+class NowPlayingState(NamedTuple):
+    """Everything the Now Playing embed shows; ``title`` is None when nothing is playing."""
+
+    guild_name: str
+    guild_icon: Optional[str]
+    title: Optional[str] = None
+    uri: Optional[str] = None
+    thumbnail: Optional[str] = None
+    duration: Optional[str] = None
+    is_stream: bool = False
+    paused: bool = False
+    volume: Optional[int] = None
+    queue_count: int = 0
+    next_title: Optional[str] = None
+    requester: Optional[str] = None
+    repeat: bool = False
+    shuffle: bool = False
+    auto_play: bool = False
+    playlist: Optional[str] = None
+    progress: Optional[str] = None
+
+
+def progress_bar(position: int, length: int, width: int = 15) -> str:
+    """Render a playback position as a text bar, e.g. ``▬▬▬🔘▬▬▬``."""
+    filled = min(width - 1, int(width * position / length)) if length else 0
+    return "▬" * filled + "🔘" + "▬" * (width - filled - 1)
+
+
+def render_now_playing(state: NowPlayingState) -> dict:
+    """Build the Now Playing embed as a Discord embed dict."""
+    if state.title is None:
+        return {
+            "type": "rich",
+            "title": "🎵 Nothing Playing",
+            "description": "There is no music playing right now.",
+            "color": 0x3498DB,
+        }
+    if state.is_stream:
+        status_indicator = "🔴 LIVE STREAM"
+    else:
+        status_indicator = "⏸️" if state.paused else "▶️"
+    author = {"name": state.guild_name, "url": "https://www.duduw.com.br"}
+    if state.guild_icon:
+        author["icon_url"] = state.guild_icon
+    fields = []
+    if state.queue_count > 0:
+        fields.append({
+            "name": "Queue",
+            "value": f"**{state.queue_count}** tracks in queue\n**Next:** {(state.next_title or 'Unknown')[:30]}...",
+            "inline": False,
+        })
+    fields.append({"name": "Volume", "value": f"{state.volume}%", "inline": True})
+    if state.requester:
+        fields.append({"name": "Requested by", "value": state.requester, "inline": True})
+    status = []
+    if state.repeat:
+        status.append("🔄 Repeat")
+    if state.shuffle:
+        status.append("🔀 Shuffle")
+    if state.auto_play:
+        status.append("⏭️ Auto-Play")
+    if status:
+        fields.append({"name": "Mode", "value": " | ".join(status), "inline": True})
+    if state.playlist:
+        fields.append({"name": "📜 Loading Playlist", "value": state.playlist, "inline": False})
+    payload = {
+        "type": "rich",
+        "title": f"{status_indicator} Now Playing",
+        "color": 0x3498DB,
+        "description": f"[**{state.title}**]({state.uri})\n\n**Duration:** `{state.duration}`"
+        + (f"\n{state.progress}" if state.progress else ""),
+        "author": author,
+        "fields": fields,
+    }
+    if state.thumbnail:
+        payload["thumbnail"] = {"url": state.thumbnail}
+    return payload
+
+
+class NowPlayingRenderer:
+    """
+    Memoizes the rendered Now Playing payload per guild, keyed by the hash of its state.
+
+    ``render`` returns None when the state is the one last rendered for the same message, so an
+    unchanged refresh costs a hash comparison and never turns into an edit.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._rendered: Dict[int, tuple] = {}  # guild_id -> (message_id, state_hash, state, payload)
+
+    def render(self, guild_id: int, message_id: int, state: NowPlayingState) -> Optional[dict]:
+        state_hash = hash(state)
+        cached = self._rendered.get(guild_id)
+        if cached and cached[0] == message_id and cached[1] == state_hash and cached[2] == state:
+            self.hits += 1
+            return None
+        self.misses += 1
+        payload = render_now_playing(state)
+        self._rendered[guild_id] = (message_id, state_hash, state, payload)
+        return payload
+
+    def forget(self, guild_id: int):
+        self._rendered.pop(guild_id, None)
+
 
 class EnhancedAudioView(discord.ui.View):
-    def __init__(self, cog, ctx, timeout=300):
+    def __init__(self, cog, ctx, timeout=CONTROLLER_TIMEOUT):
         super().__init__(timeout=timeout)
         self.cog = cog
         self.ctx = ctx
         self.message = None
-        self.update_task = None
-        self._last_state = None  # Cache for last player state
 
     async def start(self):
-        self.update_task = self.ctx.bot.loop.create_task(self.periodic_update())
+        # Refreshes are driven by the cog-wide scheduler instead of a task per view
+        self.cog.register_view(self)
 
-    async def stop(self):
-        if self.update_task:
-            self.update_task.cancel()
-        await super().stop()
+    def stop(self):
+        self.cog.unregister_view(self)
+        super().stop()
 
-    async def periodic_update(self):
-        try:
-            while not self.ctx.bot.is_closed():
-                await self.update_now_playing()
-                await asyncio.sleep(120)  # Increased to 2 minutes (120 seconds)
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            log.error(f"Error in periodic update: {e}")
+    async def on_timeout(self):
+        self.cog.unregister_view(self)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id == self.ctx.author.id:
@@ -67,210 +1166,281 @@ class EnhancedAudioView(discord.ui.View):
         )
         return False
 
-    @discord.ui.button(emoji="🔄", style=discord.ButtonStyle.secondary, row=1)
+    @discord.ui.button(
+        emoji="🔄", style=discord.ButtonStyle.secondary, row=1,
+        custom_id="enhanced_audio:repeat",
+    )
+    @timed("button", "repeat")
     async def repeat_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.current:
-            await interaction.response.send_message(
-                "Nothing is currently playing.", ephemeral=True
-            )
-            return
-        await interaction.response.defer(ephemeral=True)
-        await self.cog.original_cog.command_repeat(self.ctx)
-        guild_data = await self.cog.original_cog.config.guild(self.ctx.guild).all()
-        if guild_data["repeat"]:
-            button.style = discord.ButtonStyle.success
-            await interaction.followup.send("🔄 Repeat mode enabled", ephemeral=True)
-        else:
-            button.style = discord.ButtonStyle.secondary
-            await interaction.followup.send("🔄 Repeat mode disabled", ephemeral=True)
-        await self.update_now_playing()
+        with self.cog.outbound.interaction(interaction.guild_id):
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.current:
+                await interaction.response.send_message(
+                    "Nothing is currently playing.", ephemeral=True
+                )
+                return
+            await interaction.response.defer(ephemeral=True)
+            await self.cog.control(self.ctx, interaction.user, "repeat")
+            self.cog.settings_cache.invalidate(self.ctx.guild.id)
+            guild_data = await self.cog.get_audio_settings(self.ctx.guild)
+            if guild_data["repeat"]:
+                button.style = discord.ButtonStyle.success
+                await interaction.followup.send("🔄 Repeat mode enabled", ephemeral=True)
+            else:
+                button.style = discord.ButtonStyle.secondary
+                await interaction.followup.send("🔄 Repeat mode disabled", ephemeral=True)
+            await self.update_now_playing()
 
-    @discord.ui.button(emoji="⏮️", style=discord.ButtonStyle.primary, row=0)
+    @discord.ui.button(
+        emoji="⏮️", style=discord.ButtonStyle.primary, row=0,
+        custom_id="enhanced_audio:previous",
+    )
+    @timed("button", "previous")
     async def previous_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.current:
-            await interaction.response.send_message(
-                "Nothing is currently playing.", ephemeral=True
+        with self.cog.outbound.interaction(interaction.guild_id):
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.current:
+                await interaction.response.send_message(
+                    "Nothing is currently playing.", ephemeral=True
+                )
+                return
+            await interaction.response.defer(ephemeral=True)
+            await self.cog.control(self.ctx, interaction.user, "restart")
+            await interaction.followup.send(
+                "⏮️ Restarted the current track.", ephemeral=True
             )
-            return
-        await interaction.response.defer(ephemeral=True)
-        await self.cog.original_cog.command_seek(self.ctx, seconds=0)
-        await interaction.followup.send(
-            "⏮️ Restarted the current track.", ephemeral=True
-        )
-        await self.update_now_playing()
+            await self.update_now_playing()
 
-    @discord.ui.button(emoji="⏹️", style=discord.ButtonStyle.danger, row=0)
+    @discord.ui.button(
+        emoji="⏹️", style=discord.ButtonStyle.danger, row=0,
+        custom_id="enhanced_audio:stop",
+    )
+    @timed("button", "stop")
     async def stop_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.current:
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    "Nothing is currently playing.", ephemeral=True
-                )
-            return
-        await self.cog.delete_audio_cog_embeds(self.ctx)
-        try:
+        with self.cog.outbound.interaction(interaction.guild_id):
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.current:
+                if not interaction.response.is_done():
+                    await interaction.response.send_message(
+                        "Nothing is currently playing.", ephemeral=True
+                    )
+                return
+            await self.cog.delete_audio_cog_embeds(self.ctx)
+            try:
+                if not interaction.response.is_done():
+                    await interaction.response.defer(ephemeral=True)
+            except Exception:
+                pass
+            await self.cog.control(self.ctx, interaction.user, "stop")
+            embed = discord.Embed(
+                title="⏹️ Playback Stopped",
+                description="Music playback has been stopped.",
+                color=0xE74C3C,
+            )
             if not interaction.response.is_done():
-                await interaction.response.defer(ephemeral=True)
-        except Exception:
-            pass
-        await self.cog.original_cog.command_stop(self.ctx)
-        embed = discord.Embed(
-            title="⏹️ Playback Stopped",
-            description="Music playback has been stopped.",
-            color=0xE74C3C,
-        )
-        if not interaction.response.is_done():
-            await interaction.followup.send(embed=embed, ephemeral=True)
-        await interaction.followup.edit_message(
-            message_id=self.message.id, embed=embed, view=None
-        )
-        await self.stop()
+                await interaction.followup.send(embed=embed, ephemeral=True)
+            self.cog.edit_coalescer.submit(self.message, final=True, embed=embed, view=None)
+            self.stop()
 
-    @discord.ui.button(emoji="⏯️", style=discord.ButtonStyle.primary, row=0)
+    @discord.ui.button(
+        emoji="⏯️", style=discord.ButtonStyle.primary, row=0,
+        custom_id="enhanced_audio:play_pause",
+    )
+    @timed("button", "play_pause")
     async def play_pause_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.current:
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    _("Nothing is currently playing."), ephemeral=True
-                )
-            return
-        await self.cog.delete_audio_cog_embeds(self.ctx)
-        try:
-            if not interaction.response.is_done():
-                await interaction.response.defer(ephemeral=True)
-        except Exception:
-            pass
-        if player.paused:
-            await self.cog.original_cog.command_pause(self.ctx)
-            button.emoji = "⏸️"
-            if not interaction.response.is_done():
-                await interaction.followup.send(_("Playback resumed!"), ephemeral=True)
-        else:
-            await self.cog.original_cog.command_pause(self.ctx)
-            button.emoji = "▶️"
-            if not interaction.response.is_done():
-                await interaction.followup.send(_("Playback paused!"), ephemeral=True)
-        await interaction.followup.edit_message(message_id=self.message.id, view=self)
-        self.cog.last_activity[self.ctx.guild.id] = time.time()
+        with self.cog.outbound.interaction(interaction.guild_id):
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.current:
+                if not interaction.response.is_done():
+                    await interaction.response.send_message(
+                        _("Nothing is currently playing."), ephemeral=True
+                    )
+                return
+            await self.cog.delete_audio_cog_embeds(self.ctx)
+            try:
+                if not interaction.response.is_done():
+                    await interaction.response.defer(ephemeral=True)
+            except Exception:
+                pass
+            if not await self.cog.control(self.ctx, interaction.user, "pause"):
+                button.emoji = "⏸️"
+                if not interaction.response.is_done():
+                    await interaction.followup.send(_("Playback resumed!"), ephemeral=True)
+            else:
+                button.emoji = "▶️"
+                if not interaction.response.is_done():
+                    await interaction.followup.send(_("Playback paused!"), ephemeral=True)
+            self.cog.touch_activity(self.ctx.guild.id)
+            await self.update_now_playing()
 
-    @discord.ui.button(emoji="⏭️", style=discord.ButtonStyle.primary, row=0)
+    @discord.ui.button(
+        emoji="⏭️", style=discord.ButtonStyle.primary, row=0,
+        custom_id="enhanced_audio:skip",
+    )
+    @timed("button", "skip")
     async def skip_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.current:
-            await interaction.response.send_message(
-                "Nothing is currently playing.", ephemeral=True
-            )
-            return
-        await interaction.response.defer(ephemeral=True)
-        current_track = player.current
-        await self.cog.original_cog.command_skip(self.ctx)
-        self.cog.last_activity[self.ctx.guild.id] = time.time()
-        if current_track:
-            track_description = (
-                await self.cog.original_cog.get_track_description(
-                    current_track, self.cog.original_cog.local_folder_current_path
-                )
-                or "Unknown"
-            )
-            embed = discord.Embed(
-                title="⏭️ Track Skipped",
-                description=f"**{track_description}**",
-                color=0x3498DB,
-            )
-            if player.current:
-                next_track = (
-                    await self.cog.original_cog.get_track_description(
-                        player.current, self.cog.original_cog.local_folder_current_path
-                    )
-                    or "Unknown"
+        with self.cog.outbound.interaction(interaction.guild_id):
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.current:
+                await interaction.response.send_message(
+                    "Nothing is currently playing.", ephemeral=True
                 )
-                embed.add_field(
-                    name="🎵 Now Playing", value=f"**{next_track}**", inline=False
+                return
+            await interaction.response.defer(ephemeral=True)
+            current_track = player.current
+            await self.cog.control(self.ctx, interaction.user, "skip")
+            self.cog.touch_activity(self.ctx.guild.id)
+            if current_track:
+                track_description = await self.cog.describe_track(current_track)
+                embed = discord.Embed(
+                    title="⏭️ Track Skipped",
+                    description=f"**{track_description}**",
+                    color=0x3498DB,
                 )
-            await interaction.followup.send(embed=embed, ephemeral=True)
-        await self.update_now_playing()
+                if player.current:
+                    next_track = await self.cog.describe_track(player.current)
+                    embed.add_field(
+                        name="🎵 Now Playing", value=f"**{next_track}**", inline=False
+                    )
+                await interaction.followup.send(embed=embed, ephemeral=True)
+            await self.update_now_playing()
 
-    @discord.ui.button(emoji="🔀", style=discord.ButtonStyle.secondary, row=1)
+    @discord.ui.button(
+        emoji="🔀", style=discord.ButtonStyle.secondary, row=1,
+        custom_id="enhanced_audio:shuffle",
+    )
+    @timed("button", "shuffle")
     async def shuffle_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.current:
-            await interaction.response.send_message(
-                "Nothing is currently playing.", ephemeral=True
-            )
-            return
-        await interaction.response.defer(ephemeral=True)
-        await self.cog.original_cog.command_shuffle(self.ctx)
-        guild_data = await self.cog.original_cog.config.guild(self.ctx.guild).all()
-        if guild_data["shuffle"]:
-            button.style = discord.ButtonStyle.success
-            await interaction.followup.send("🔀 Shuffle mode enabled", ephemeral=True)
-        else:
-            button.style = discord.ButtonStyle.secondary
-            await interaction.followup.send("🔀 Shuffle mode disabled", ephemeral=True)
-        await self.update_now_playing()
+        with self.cog.outbound.interaction(interaction.guild_id):
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.current:
+                await interaction.response.send_message(
+                    "Nothing is currently playing.", ephemeral=True
+                )
+                return
+            await interaction.response.defer(ephemeral=True)
+            await self.cog.control(self.ctx, interaction.user, "shuffle")
+            self.cog.settings_cache.invalidate(self.ctx.guild.id)
+            guild_data = await self.cog.get_audio_settings(self.ctx.guild)
+            if guild_data["shuffle"]:
+                button.style = discord.ButtonStyle.success
+                await interaction.followup.send("🔀 Shuffle mode enabled", ephemeral=True)
+            else:
+                button.style = discord.ButtonStyle.secondary
+                await interaction.followup.send("🔀 Shuffle mode disabled", ephemeral=True)
+            await self.update_now_playing()
 
-    @discord.ui.button(emoji="🔊", style=discord.ButtonStyle.secondary, row=1)
+    @discord.ui.button(
+        emoji="🔊", style=discord.ButtonStyle.secondary, row=1,
+        custom_id="enhanced_audio:volume_up",
+    )
+    @timed("button", "volume_up")
     async def volume_up_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.current:
-            await interaction.response.send_message(
-                "Nothing is currently playing.", ephemeral=True
+        with self.cog.outbound.interaction(interaction.guild_id):
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.current:
+                await interaction.response.send_message(
+                    "Nothing is currently playing.", ephemeral=True
+                )
+                return
+            await self.cog.delete_audio_cog_embeds(self.ctx)
+            await interaction.response.defer(ephemeral=True)
+            new_volume = await self.cog.control(self.ctx, interaction.user, "volume", 10)
+            await interaction.followup.send(
+                f"🔊 Volume increased to {new_volume}%", ephemeral=True
             )
-            return
-        await self.cog.delete_audio_cog_embeds(self.ctx)
-        await interaction.response.defer(ephemeral=True)
-        current_volume = await self.cog.original_cog.config.guild(
-            self.ctx.guild
-        ).volume()
-        new_volume = min(150, current_volume + 10)
-        await self.cog.original_cog.command_volume(self.ctx, vol=new_volume)
-        await interaction.followup.send(
-            f"🔊 Volume increased to {new_volume}%", ephemeral=True
-        )
-        await self.update_now_playing()
+            await self.update_now_playing()
 
-    @discord.ui.button(emoji="🔉", style=discord.ButtonStyle.secondary, row=1)
+    @discord.ui.button(
+        emoji="🔉", style=discord.ButtonStyle.secondary, row=1,
+        custom_id="enhanced_audio:volume_down",
+    )
+    @timed("button", "volume_down")
     async def volume_down_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.current:
-            await interaction.response.send_message(
-                "Nothing is currently playing.", ephemeral=True
+        with self.cog.outbound.interaction(interaction.guild_id):
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.current:
+                await interaction.response.send_message(
+                    "Nothing is currently playing.", ephemeral=True
+                )
+                return
+            await self.cog.delete_audio_cog_embeds(self.ctx)
+            await interaction.response.defer(ephemeral=True)
+            new_volume = await self.cog.control(self.ctx, interaction.user, "volume", -10)
+            await interaction.followup.send(
+                f"🔉 Volume decreased to {new_volume}%", ephemeral=True
             )
-            return
-        await self.cog.delete_audio_cog_embeds(self.ctx)
-        await interaction.response.defer(ephemeral=True)
-        current_volume = await self.cog.original_cog.config.guild(
-            self.ctx.guild
-        ).volume()
-        new_volume = max(0, current_volume - 10)
-        await self.cog.original_cog.command_volume(self.ctx, vol=new_volume)
-        await interaction.followup.send(
-            f"🔉 Volume decreased to {new_volume}%", ephemeral=True
+            await self.update_now_playing()
+
+    def now_playing_state(self, player: lavalink.Player, guild_data: dict) -> "NowPlayingState":
+        guild = self.ctx.guild
+        icon = guild.icon.url if guild.icon else None
+        current = player.current
+        if not current:
+            return NowPlayingState(guild.name, icon)
+        requester = getattr(current, 'requester', None)
+        requester_mention = None
+        if requester:
+            member = self.cog.requester_index.resolve(guild, requester)
+            requester_mention = member.mention if member else f"{requester}"
+        return NowPlayingState(
+            guild.name,
+            icon,
+            title=getattr(current, 'title', 'Unknown'),
+            uri=getattr(current, 'uri', None),
+            thumbnail=getattr(current, 'thumbnail', None),
+            duration="LIVE" if current.is_stream else self.cog.original_cog.format_time(current.length),
+            is_stream=current.is_stream,
+            paused=player.paused,
+            volume=guild_data.get('volume'),
+            queue_count=len(player.queue),
+            next_title=getattr(player.queue[0], 'title', 'Unknown') if player.queue else None,
+            requester=requester_mention,
+            repeat=bool(guild_data.get('repeat')),
+            shuffle=bool(guild_data.get('shuffle')),
+            auto_play=bool(guild_data.get('auto_play')),
+            playlist=self.cog.playlist_progress(guild.id),
+            progress=self.live_progress(player),
+        )
+
+    def live_progress(self, player: lavalink.Player) -> Optional[str]:
+        """Position bar for controllers refreshed often enough for it to look live."""
+        current = player.current
+        if current.is_stream:
+            return None
+        # The interval picked when this refresh was scheduled; recomputing it here would count
+        # every active controller once per controller
+        session = self.cog.sessions.get(self.ctx.guild.id)
+        interval = session.refresh_interval if session else None
+        if interval is None:
+            interval = self.cog.refresh_interval(self.ctx.guild.id)
+        if interval > LIVE_PROGRESS_INTERVAL:
+            return None
+        format_time = self.cog.original_cog.format_time
+        return (
+            f"{progress_bar(player.position, current.length)} "
+            f"`{format_time(player.position)}/{format_time(current.length)}`"
         )
-        await self.update_now_playing()
 
+    @timed("refresh", "now_playing")
     async def update_now_playing(self):
-        if not self.message:
+        if not self.message or self.is_finished():
             return
         try:
             # Check if player exists for this guild, if not stop the update task
@@ -279,151 +1449,92 @@ class EnhancedAudioView(discord.ui.View):
             except Exception as e:
                 if "No such player for that guild" in str(e):
                     log.debug(f"Player no longer exists for guild {self.ctx.guild.id}, stopping updates")
-                    if self.update_task:
-                        self.update_task.cancel()
                     self.stop()
                     return
                 else:
                     # Re-raise unexpected exceptions
                     raise
                 
-            guild_data = await self.cog.original_cog.config.guild(self.ctx.guild).all()
-            # Gather current state for comparison
-            state = {
-                'track_id': getattr(player.current, 'identifier', None) if player.current else None,
-                'paused': player.paused if player.current else None,
-                'volume': await self.cog.original_cog.config.guild(self.ctx.guild).volume() if player.current else None,
-                'queue_len': len(player.queue) if player else 0,
-                'repeat': guild_data.get('repeat'),
-                'shuffle': guild_data.get('shuffle'),
-                'auto_play': guild_data.get('auto_play'),
-            }
-            # Only update if state has changed (removed position checking)
-            if state == self._last_state:
-                return
-            self._last_state = state
-            if not player.current:
-                embed = discord.Embed(
-                    title="🎵 Nothing Playing",
-                    description="There is no music playing right now.",
-                    color=0x3498DB,
-                )
-                try:
-                    await self.message.edit(embed=embed, view=self)
-                except discord.NotFound:
-                    if self.update_task:
-                        self.update_task.cancel()
-                        self.stop()
-                except discord.HTTPException as e:
-                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                        log.debug("Invalid webhook token, stopping updates")
-                        if self.update_task:
-                            self.update_task.cancel()
-                            self.stop()
-                return
-            
-            # No progress tracking - just show duration
-            if player.current.is_stream:
-                dur = "LIVE"
-                status_indicator = "🔴 LIVE STREAM"
-            else:
-                dur = self.cog.original_cog.format_time(player.current.length)
-                status_indicator = "▶️" if not player.paused else "⏸️"
-            
-            volume = state['volume']
-            guild = self.ctx.guild
-            author_icon = guild.icon.url if guild.icon else discord.Embed.Empty
-            track_title = getattr(player.current, 'title', 'Unknown')
-            track_uri = getattr(player.current, 'uri', None)
-            track_thumbnail = getattr(player.current, 'thumbnail', None)
-            requester = getattr(player.current, 'requester', None)
-            requester_mention = None
-            if requester:
-                member = None
-                try:
-                    user_id = int(requester)
-                    member = self.ctx.guild.get_member(user_id)
-                except Exception:
-                    member = discord.utils.find(lambda m: m.name == str(requester) or m.display_name == str(requester), self.ctx.guild.members)
-                if member:
-                    requester_mention = member.mention
-                else:
-                    requester_mention = f"{requester}"
-            
-            # Build a static embed with no progress tracking
-            embed = discord.Embed(
-                title=f"{status_indicator} Now Playing",
-                color=0x3498DB,
-                description=f"[**{track_title}**]({track_uri})\n\n**Duration:** `{dur}`"
+            # The player is alive, so keep the controller alive until the next refresh
+            self.timeout = CONTROLLER_TIMEOUT
+            guild_data = await self.cog.get_audio_settings(self.ctx.guild)
+            state = self.now_playing_state(player, guild_data)
+            payload = self.cog.now_playing_renderer.render(self.ctx.guild.id, self.message.id, state)
+            if payload is None:
+                return  # Already on screen
+            # A failed edit leaves the old embed up, so render again on the next refresh
+            self.cog.edit_coalescer.submit(
+                self.message,
+                on_gone=self.stop,
+                on_failed=functools.partial(self.cog.now_playing_renderer.forget, self.ctx.guild.id),
+                embed=discord.Embed.from_dict(payload),
+                view=self,
             )
-            embed.set_author(name=guild.name, url="https://www.duduw.com.br", icon_url=author_icon)
-            if track_thumbnail:
-                embed.set_thumbnail(url=track_thumbnail)
-            
-            # Show queue information
-            queue_count = len(player.queue)
-            if queue_count > 0:
-                next_track_title = "Unknown"
-                if player.queue:
-                    next_track = player.queue[0]
-                    next_track_title = getattr(next_track, 'title', 'Unknown')
-                embed.add_field(
-                    name="Queue", 
-                    value=f"**{queue_count}** tracks in queue\n**Next:** {next_track_title[:30]}...", 
-                    inline=False
-                )
-            
-            embed.add_field(name="Volume", value=f"{volume}%", inline=True)
-            if requester_mention:
-                embed.add_field(name="Requested by", value=requester_mention, inline=True)
-            
-            # Add status flags as emoji at the bottom
-            status = []
-            if guild_data["repeat"]:
-                status.append("🔄 Repeat")
-            if guild_data["shuffle"]:
-                status.append("🔀 Shuffle")
-            if guild_data["auto_play"]:
-                status.append("⏭️ Auto-Play")
-            
-            if status:
-                embed.add_field(name="Mode", value=" | ".join(status), inline=True)
-            
-            try:
-                await self.message.edit(embed=embed, view=self)
-            except discord.NotFound:
-                if self.update_task:
-                    self.update_task.cancel()
-                    self.stop()
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token, stopping updates")
-                    if self.update_task:
-                        self.update_task.cancel()
-                        self.stop()
-                else:
-                    # Reraise for other HTTP exceptions
-                    raise
-            self.timeout = 300
         except Exception as e:
             log.error(f"Error updating embed: {e}")
             # If we get persistent errors, stop the update task
             if "No such player for that guild" in str(e):
                 log.debug(f"Player no longer exists for guild {self.ctx.guild.id}, stopping updates")
-                if self.update_task:
-                    self.update_task.cancel()
                 self.stop()
             # Don't try to fetch the message again if there's an error
 
 
+class PersistentControllerView(discord.ui.View):
+    """
+    Handles controller buttons whose EnhancedAudioView is gone, e.g. after a restart.
+
+    A single instance is registered with ``bot.add_view`` and serves every registered controller
+    message through the buttons' stable custom IDs. The first press on a message adopts it into a
+    live EnhancedAudioView, which handles that press and every later one.
+    """
+
+    def __init__(self, cog):
+        super().__init__(timeout=None)
+        self.cog = cog
+        for item in EnhancedAudioView(cog, None, timeout=None).children:
+            button = discord.ui.Button(
+                emoji=item.emoji, style=item.style, row=item.row, custom_id=item.custom_id
+            )
+            button.callback = functools.partial(self._forward, item.custom_id)
+            self.add_item(button)
+
+    async def _forward(self, custom_id: str, interaction: discord.Interaction):
+        with self.cog.outbound.interaction(interaction.guild_id):
+            view = await self.cog.adopt_controller(interaction)
+            if view is None:
+                if interaction.response.is_done():
+                    return
+                await interaction.response.send_message(
+                    "This player is no longer active. Use `/play` to start a new one.", ephemeral=True
+                )
+                return
+            if not await view.interaction_check(interaction):
+                return
+            item = discord.utils.get(view.children, custom_id=custom_id)
+            await item.callback(interaction)
+
+
 class EnhancedQueueView(discord.ui.View):
-    def __init__(self, cog, ctx, pages, timeout=300):
+    """
+    Paged queue browser backed by a versioned model of the queue.
+
+    Track descriptions are kept per queue position together with the track they describe, so a
+    row is reused only while that exact track is still at that position. Skips are recognised
+    from the head of the queue and shift the rows instead of discarding them; anything else
+    that reorders the queue bumps ``version``, which invalidates the rendered pages.
+    """
+
+    def __init__(self, cog, ctx, timeout=300):
         super().__init__(timeout=timeout)
         self.cog = cog
         self.ctx = ctx
-        self.pages = pages
+        self.pages: Dict[int, tuple] = {}  # page -> (version, signature, embed), around current_page
+        self.rows: Dict[int, tuple] = {}  # queue position -> (track, description)
+        self.version = 0
         self.current_page = 0
         self.message = None
+        self._head: tuple = ()  # First tracks of the queue when it was last synced
+        self._prefetch_task = None
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id == self.ctx.author.id:
@@ -433,60 +1544,136 @@ class EnhancedQueueView(discord.ui.View):
         )
         return False
 
+    def sync(self, player: lavalink.Player):
+        """Bring the model in line with the player's queue, shifting rows after skips."""
+        queue = player.queue
+        head = queue[0] if queue else None
+        if head is (self._head[0] if self._head else None):
+            return
+        shift = next((k for k, track in enumerate(self._head) if track is head), None)
+        if shift is None:
+            self.rows.clear()
+        else:
+            self.rows = {pos - shift: row for pos, row in self.rows.items() if pos >= shift}
+        self.version += 1
+        self._head = tuple(queue[:QUEUE_SHIFT_LOOKAHEAD])
+
+    def invalidate(self):
+        """Forget every rendered row and page, e.g. after the queue was shuffled."""
+        self.rows.clear()
+        self.pages.clear()
+        self.version += 1
+
+    def _signature(self, player: lavalink.Player, page: int) -> tuple:
+        return len(player.queue), id(player.current) if page == 0 else None
+
+    def _cached_page(self, player: lavalink.Player, page: int) -> Optional[discord.Embed]:
+        entry = self.pages.get(page)
+        if entry is None or entry[0] != self.version or entry[1] != self._signature(player, page):
+            return None
+        queue = player.queue
+        start = page * QUEUE_PAGE_SIZE
+        for pos in range(start, min(start + QUEUE_PAGE_SIZE, len(queue))):
+            row = self.rows.get(pos)
+            if row is None or row[0] is not queue[pos]:
+                return None
+        return entry[2]
+
+    async def _render(self, player: lavalink.Player, page: int) -> discord.Embed:
+        version, signature = self.version, self._signature(player, page)
+        embed = await self.cog.create_queue_page(self.ctx, page, rows=self.rows)
+        self.pages[page] = (version, signature, embed)
+        return embed
+
+    async def show_page(self, page: int, *, prefetch: bool = True) -> discord.Embed:
+        """Render (or reuse) a single page and prefetch its neighbours in the background."""
+        player = lavalink.get_player(self.ctx.guild.id)
+        self.sync(player)
+        page_count = self.cog.queue_page_count(player)
+        self.current_page = page % page_count
+        embed = self._cached_page(player, self.current_page)
+        if embed is None:
+            embed = await self._render(player, self.current_page)
+        window = {
+            (self.current_page + offset) % page_count
+            for offset in range(-QUEUE_PREFETCH_PAGES, QUEUE_PREFETCH_PAGES + 1)
+        }
+        for index in [i for i in self.pages if i not in window]:
+            del self.pages[index]
+        for pos in [p for p in self.rows if p // QUEUE_PAGE_SIZE not in window]:
+            del self.rows[pos]
+        if self._prefetch_task:
+            self._prefetch_task.cancel()
+        missing = [i for i in window if self._cached_page(player, i) is None]
+        if prefetch and missing:
+            self._prefetch_task = asyncio.get_event_loop().create_task(self._prefetch(player, missing))
+        return embed
+
+    async def _prefetch(self, player: lavalink.Player, pages: List[int]):
+        for index in pages:
+            try:
+                await self._render(player, index)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.debug(f"Error prefetching queue page {index}: {e}")
+                return
+
+    def stop(self):
+        if self._prefetch_task:
+            self._prefetch_task.cancel()
+        super().stop()
+
     @discord.ui.button(emoji="⬅️", style=discord.ButtonStyle.secondary)
     async def previous_page(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        if self.current_page == 0:
-            self.current_page = len(self.pages) - 1
-        else:
-            self.current_page -= 1
-        await interaction.response.edit_message(
-            embed=self.pages[self.current_page], view=self
-        )
-        self.timeout = 300
+        with self.cog.outbound.interaction(interaction.guild_id):
+            embed = await self.show_page(self.current_page - 1)
+            await interaction.response.edit_message(embed=embed, view=self)
+            self.timeout = 300
 
     @discord.ui.button(emoji="➡️", style=discord.ButtonStyle.secondary)
     async def next_page(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        if self.current_page == len(self.pages) - 1:
-            self.current_page = 0
-        else:
-            self.current_page += 1
-        await interaction.response.edit_message(
-            embed=self.pages[self.current_page], view=self
-        )
-        self.timeout = 300
+        with self.cog.outbound.interaction(interaction.guild_id):
+            embed = await self.show_page(self.current_page + 1)
+            await interaction.response.edit_message(embed=embed, view=self)
+            self.timeout = 300
 
     @discord.ui.button(emoji="🔄", style=discord.ButtonStyle.secondary)
     async def shuffle_queue(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        await interaction.response.defer(ephemeral=True)
-        await self.cog.original_cog.command_shuffle(self.ctx)
-        player = lavalink.get_player(self.ctx.guild.id)
-        if not player.queue:
-            await interaction.followup.send(
-                "Queue is empty after shuffling.", ephemeral=True
+        with self.cog.outbound.interaction(interaction.guild_id):
+            await interaction.response.defer(ephemeral=True)
+            await self.cog.control(self.ctx, interaction.user, "shuffle")
+            self.cog.settings_cache.invalidate(self.ctx.guild.id)
+            player = lavalink.get_player(self.ctx.guild.id)
+            if not player.queue:
+                await interaction.followup.send(
+                    "Queue is empty after shuffling.", ephemeral=True
+                )
+                return
+            # Every position may hold a different track now; only the visible page is re-rendered
+            self.invalidate()
+            embed = await self.show_page(self.current_page, prefetch=False)
+            await interaction.followup.send("🔀 Queue shuffled!", ephemeral=True)
+            await interaction.followup.edit_message(
+                message_id=self.message.id, embed=embed, view=self
             )
-            return
-        self.pages = await self.cog.create_queue_pages(self.ctx)
-        self.current_page = 0
-        await interaction.followup.send("🔀 Queue shuffled!", ephemeral=True)
-        await interaction.followup.edit_message(
-            message_id=self.message.id, embed=self.pages[0], view=self
-        )
-        self.timeout = 300
+            self.timeout = 300
 
     @discord.ui.button(emoji="❌", style=discord.ButtonStyle.danger)
     async def close_menu(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        await interaction.response.defer(ephemeral=True)
-        await interaction.message.delete()
-        await interaction.followup.send("Queue menu closed", ephemeral=True)
-        self.stop()
+        with self.cog.outbound.interaction(interaction.guild_id):
+            await interaction.response.defer(ephemeral=True)
+            await interaction.message.delete()
+            await interaction.followup.send("Queue menu closed", ephemeral=True)
+            self.stop()
 
 
 class EnhancedAudio(commands.Cog):
@@ -501,12 +1688,79 @@ class EnhancedAudio(commands.Cog):
         self.config = Config.get_conf(
             self, identifier=13371337, force_registration=True
         )
+        self.config.register_global(
+            cleanup_flush_interval=2.0, idle_teardown_concurrency=8, idle_teardown_timeout=10.0,
+            refresh_budget=REFRESH_BUDGET,
+        )
+        self.refresh_budget = RefreshBudget()
+        self.rate_limit_watcher = RateLimitWatcher(self.refresh_budget)
+        self.refresh_overrides: Dict[int, float] = {}
+        self.cleanup_flush_interval = 2.0
+        self.idle_teardown_timeout = 10.0
+        self.idle_teardown_semaphore = asyncio.Semaphore(8)
+        self.last_idle_sweep = None  # Stats of the most recent inactivity sweep
+        self.config.register_guild(
+            controller=None,  # [channel_id, message_id, owner_id] of the controller
+            fast_controls=False,
+            refresh_interval=None,  # Seconds; lower bound for the budgeted refresh interval
+        )
+        self.fast_control_guilds = set()
+        self.control_actors: Dict[int, GuildControlActor] = {}
+        self.playlist_loads: Dict[int, PlaylistLoad] = {}
+        self._config_writes = set()
+        self.sessions: Dict[int, GuildSession] = {}
+        # Every controller ever registered, so views that outlive their session show up as leaks
+        self.view_refs: "weakref.WeakSet[EnhancedAudioView]" = weakref.WeakSet()
+        self.persistent_view = None
         self.original_cog = None
-        self.last_activity = {}
-        self.last_messages = {}
-        self.inactivity_task = self.inactivity_check.start()
+        self.metrics = MetricsRegistry()
+        self.settings_cache = AudioSettingsCache(self.metrics)
+        self.track_descriptions = TrackDescriptionCache()
+        self.query_cache = QueryResolutionCache(cog_data_path(self) / "queries.sqlite3")
+        self.outbound = OutboundQueue(self.metrics)
+        self.outbound.start()
+        self.edit_coalescer = MessageEditCoalescer(self.metrics, self.outbound)
+        self.now_playing_renderer = NowPlayingRenderer()
+        self.requester_index = RequesterIndex()
+        self.notification_index: Dict[int, deque] = {}  # channel_id -> notification message IDs
+        self.cleanup_deferred_since: Dict[int, float] = {}  # channel_id -> first deferral
+        self.cleanup_scheduler = DeadlineScheduler(
+            self._flush_notifications, name="cleanup scheduler"
+        )
+        self.cleanup_scheduler.start()
+        self.refresh_scheduler = DeadlineScheduler(
+            self._refresh_controllers, name="refresh scheduler"
+        )
+        self.refresh_scheduler.start()
+        lavalink.register_event_listener(self.lavalink_event_handler)
+        self.inactivity_scheduler = DeadlineScheduler(
+            self.inactivity_check, name="inactivity scheduler"
+        )
+        self.inactivity_scheduler.start()
         self.bot.loop.create_task(self._find_original_cog())
 
+    async def cog_load(self):
+        settings = await self.config.all()
+        self.cleanup_flush_interval = settings["cleanup_flush_interval"]
+        self.idle_teardown_timeout = settings["idle_teardown_timeout"]
+        self.idle_teardown_semaphore = asyncio.Semaphore(settings["idle_teardown_concurrency"])
+        self.refresh_budget.edits_per_minute = settings["refresh_budget"]
+        logging.getLogger("discord.http").addHandler(self.rate_limit_watcher)
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            if guild_data["controller"]:
+                self.sessions[guild_id] = GuildSession(*guild_data["controller"])
+            if guild_data["fast_controls"]:
+                self.fast_control_guilds.add(guild_id)
+            if guild_data["refresh_interval"]:
+                self.refresh_overrides[guild_id] = guild_data["refresh_interval"]
+        try:
+            await self.query_cache.open()
+        except sqlite3.Error as e:
+            log.warning(f"[EnhancedAudio] Query cache database unavailable, using memory only: {e}")
+        self.persistent_view = PersistentControllerView(self)
+        self.bot.add_view(self.persistent_view)
+        self.export_metrics.start()
+
     async def _find_original_cog(self):
         await self.bot.wait_until_ready()
         self.original_cog = self.bot.get_cog("Audio")
@@ -515,48 +1769,723 @@ class EnhancedAudio(commands.Cog):
                 "Could not find the original Audio cog. EnhancedAudio will not work properly."
             )
 
-    from discord.ext import tasks
+    async def run_audio_command(self, name: str, ctx: commands.Context, **kwargs):
+        """Invoke one of the Audio cog's commands, counting the call."""
+        self.metrics.count("audio_command")
+        return await getattr(self.original_cog, name)(ctx, **kwargs)
+
+    async def get_audio_settings(self, guild: discord.Guild, *, fresh: bool = False) -> dict:
+        """Return the cached Audio cog settings, re-read first when ``fresh`` is set."""
+        return await self.settings_cache.get(self.original_cog.config, guild, fresh=fresh)
+
+    async def describe_track(self, track) -> str:
+        """Describe a track like the Audio cog does, memoized by track and local folder."""
+        local_folder = self.original_cog.local_folder_current_path
+        key = TrackDescriptionCache.key(track, local_folder)
+        if key is not None:
+            description = self.track_descriptions.get(key)
+            if description is not None:
+                return description
+        description = (
+            await self.original_cog.get_track_description(track, local_folder) or "Unknown"
+        )
+        if key is not None:
+            self.track_descriptions.put(key, description)
+        return description
+
+    async def fast_player(
+        self, ctx: commands.Context, member: Optional[discord.Member] = None, *, voted: bool = False
+    ) -> Optional[lavalink.Player]:
+        """
+        Return the guild's player when a control may skip the Audio cog's command.
+
+        Returns None when fast controls are off for the guild or ``member`` is not cleared to
+        control playback; callers then fall back to the Audio command, which explains why.
+        ``voted`` controls are the ones the Audio cog also restricts while vote skipping is on.
+        """
+        if ctx.guild.id not in self.fast_control_guilds:
+            return None
+        try:
+            player = lavalink.get_player(ctx.guild.id)
+        except KeyError:
+            return None
+        if not player.current or not player.channel:
+            return None
+        member = member or ctx.author
+        in_channel = bool(member.voice and member.voice.channel == player.channel)
+        guild_data = await self.get_audio_settings(ctx.guild, fresh=True)
+        if not in_channel or guild_data["dj_enabled"] or (voted and guild_data["vote_enabled"]):
+            if not await self.original_cog._can_instaskip(ctx, member):
+                return None
+        return player
+
+    def _write_audio_setting(self, guild: discord.Guild, name: str, value):
+        """Persist an Audio cog setting in the background; the player already reflects it."""
+        self.metrics.count("config_write")
+        task = asyncio.get_event_loop().create_task(
+            self.original_cog.config.guild(guild).get_attr(name).set(value)
+        )
+        self._config_writes.add(task)
+        task.add_done_callback(self._config_writes.discard)
+
+    async def toggle_pause(self, ctx: commands.Context, member: Optional[discord.Member] = None) -> bool:
+        """Pause or resume playback, returning whether the player is now paused."""
+        player = await self.fast_player(ctx, member)
+        if player is None:
+            await self.run_audio_command("command_pause", ctx)
+            return lavalink.get_player(ctx.guild.id).paused
+        self.metrics.count("lavalink_call")
+        await player.pause(not player.paused)
+        return player.paused
+
+    async def set_volume(
+        self, ctx: commands.Context, volume: int, member: Optional[discord.Member] = None
+    ) -> int:
+        """Set the playback volume, returning the volume actually applied."""
+        player = await self.fast_player(ctx, member)
+        if player is None:
+            await self.run_audio_command("command_volume", ctx, vol=volume)
+            # The Audio cog clamps to its max volume or refuses outright, so read back what it kept
+            return (await self.get_audio_settings(ctx.guild, fresh=True))["volume"]
+        max_volume = (await self.get_audio_settings(ctx.guild))["max_volume"] or 150
+        volume = max(0, min(volume, max_volume))
+        self.metrics.count("lavalink_call")
+        await player.set_volume(volume)
+        self.settings_cache.update(ctx.guild.id, volume=volume)
+        self._write_audio_setting(ctx.guild, "volume", volume)
+        return volume
+
+    async def restart_track(self, ctx: commands.Context, member: Optional[discord.Member] = None):
+        """Seek back to the start of the current track."""
+        player = await self.fast_player(ctx, member, voted=True)
+        if player is None or not player.current.seekable:
+            await self.run_audio_command("command_seek", ctx, seconds=0)
+            return
+        self.metrics.count("lavalink_call")
+        await player.seek(0)
+
+    async def control(self, ctx: commands.Context, member: discord.Member, kind: str, amount: int = 1):
+        """Queue a control action on the guild's actor and wait for its (possibly merged) result."""
+        actor = self.control_actors.get(ctx.guild.id)
+        if actor is None:
+            actor = self.control_actors[ctx.guild.id] = GuildControlActor(self)
+        return await actor.submit(kind, ctx, member, amount)
+
+    async def apply_control(self, kind: str, ctx: commands.Context, member: discord.Member, amount: int):
+        """Run one, possibly merged, control action. Only called by a GuildControlActor."""
+        if kind == "volume":
+            guild_data = await self.get_audio_settings(ctx.guild)
+            max_volume = guild_data["max_volume"] or 150
+            return await self.set_volume(ctx, max(0, min(max_volume, guild_data["volume"] + amount)), member)
+        if kind == "set_volume":
+            return await self.set_volume(ctx, amount, member)
+        if kind == "skip":
+            if amount > 1:
+                # The Audio cog refuses to skip past the end of the queue, so stop at its last track
+                try:
+                    amount = min(amount, len(lavalink.get_player(ctx.guild.id).queue))
+                except KeyError:
+                    amount = 1
+            if amount > 1:
+                return await self.run_audio_command("command_skip", ctx, skip_to_track=amount)
+            return await self.run_audio_command("command_skip", ctx)
+        if kind == "pause":
+            return await self.toggle_pause(ctx, member)
+        if kind == "restart":
+            return await self.restart_track(ctx, member)
+        if kind == "stop":
+            self.cancel_playlist_load(ctx.guild.id)
+        return await self.run_audio_command(f"command_{kind}", ctx)
+
+    def classify_query(self, query: str):
+        """
+        Parse ``query`` like the Audio cog does, returning None unless it may skip ``command_play``.
+
+        Only plain searches and non-Spotify URLs qualify; Spotify, local tracks and anything the
+        Audio cog does not consider valid stay on its own play path.
+        """
+        if Query is None:
+            return None
+        query_obj = Query.process_input(query, self.original_cog.local_folder_current_path)
+        if not query_obj.valid or query_obj.is_spotify or query_obj.is_local:
+            return None
+        if not (query_obj.is_search or query_obj.is_url):
+            return None
+        return query_obj
+
+    async def resolve_query(self, player: lavalink.Player, query_obj):
+        """Resolve a parsed Query through the query cache, asking Lavalink only on a miss."""
+        lavalink_query = query_obj.lavalink_query
+        key = QueryResolutionCache.normalize(lavalink_query, query_obj.is_search)
+        raw = await self.query_cache.get(key)
+        if raw is None:
+            self.metrics.count("lavalink_call")
+            result = await player.load_tracks(lavalink_query)
+            if result.has_error or not result.tracks:
+                return result
+            raw = result._raw  # red-lavalink keeps the loadtracks response it was built from
+            await self.query_cache.put(key, raw)
+            return result
+        return lavalink.rest_api.LoadResult(raw)
+
+    async def _audio_restricted(self, ctx: commands.Context, query_obj=None) -> bool:
+        """
+        Whether an Audio setting the play command enforces is in use.
+
+        Those are the DJ role, jukebox, length limit, keyword lists and, for ``query_obj``, the
+        URL restriction; tracks then have to be enqueued by the Audio cog itself.
+        """
+        guild_data = await self.get_audio_settings(ctx.guild, fresh=True)
+        if guild_data["dj_enabled"] or guild_data["jukebox"] or guild_data["maxlength"]:
+            return True
+        if guild_data["url_keyword_blacklist"] or guild_data["url_keyword_whitelist"]:
+            return True
+        audio_config = self.original_cog.config
+        self.metrics.count("config_read")
+        if await audio_config.url_keyword_blacklist() or await audio_config.url_keyword_whitelist():
+            return True
+        if query_obj is not None and query_obj.is_url and await audio_config.restrict():
+            return not self.original_cog.is_url_allowed(str(query_obj))
+        return False
+
+    async def _direct_play_player(self, ctx: commands.Context, query_obj=None) -> Optional[lavalink.Player]:
+        """
+        Return the player when tracks may be enqueued without the Audio cog's play command.
+
+        That is only the case when the player is already connected to the author's channel and
+        the Audio settings are not restricted (see ``_audio_restricted``); everything else still
+        goes through ``command_play``.
+        """
+        try:
+            player = lavalink.get_player(ctx.guild.id)
+        except KeyError:
+            return None
+        if not player.channel or not (ctx.author.voice and ctx.author.voice.channel == player.channel):
+            return None
+        if await self._audio_restricted(ctx, query_obj):
+            return None
+        return player
+
+    def _enqueue_track(self, ctx: commands.Context, player: lavalink.Player, track):
+        """Add a track to the queue the way the Audio cog's enqueue does."""
+        track.extras.update(
+            {"enqueue_time": int(time.time()), "vc": player.channel.id, "requester": ctx.author.id}
+        )
+        player.add(ctx.author, track)
+        self.bot.dispatch("red_audio_track_enqueue", player.guild, track, ctx.author)
+
+    async def play_cached(self, ctx: commands.Context, query: str) -> bool:
+        """
+        Enqueue the first track for ``query`` straight from the resolution cache.
+
+        Returns False when the Audio cog's play command has to handle the query instead, e.g.
+        for playlists, Spotify links, a disconnected player or restrictive Audio settings. That is
+        decided before anything is resolved, so a query is never loaded twice.
+        """
+        query_obj = self.classify_query(query)
+        if query_obj is None or query_obj.is_playlist:
+            return False
+        if not (query_obj.is_search or query_obj.single_track) or query_obj.start_time or query_obj.track_index:
+            # The play command enqueues whole sets, or seeks or picks a track from the URL
+            return False
+        player = await self._direct_play_player(ctx, query_obj)
+        if player is None or len(player.queue) >= MAX_QUEUE_LENGTH:
+            return False
+        result = await self.resolve_query(player, query_obj)
+        if result.has_error or not result.tracks:
+            # Lavalink already answered; the play command would only load the query again
+            await ctx.send((result.has_error and result.exception_message) or "Nothing found.")
+            return True
+        self._enqueue_track(ctx, player, result.tracks[0])
+        player.maybe_shuffle()
+        player.store("notify_channel", ctx.channel.id)
+        if not player.current:
+            self.metrics.count("lavalink_call")
+            await player.play()
+        return True
+
+    async def find_saved_playlist(self, ctx: commands.Context, name: str):
+        """Find an Audio cog saved playlist by name or ID, checking server, user and global scope."""
+        if get_all_playlist is None:
+            return None
+        for scope in (PlaylistScope.GUILD, PlaylistScope.USER, PlaylistScope.GLOBAL):
+            playlists = await get_all_playlist(
+                scope.value, self.bot, self.original_cog.playlist_api, ctx.guild, ctx.author
+            )
+            for playlist in playlists:
+                if playlist.name.lower() == name.lower() or str(playlist.id) == name:
+                    return playlist
+        return None
+
+    @staticmethod
+    def _playlist_matches(playlist, name: str) -> dict:
+        """Build the matches ``command_playlist_start`` expects from its converter for ``playlist``."""
+        matches = {scope.value: [] for scope in PlaylistScope}
+        matches[playlist.scope].append(playlist)
+        matches.update({"all": [playlist], "arg": name})
+        return matches
+
+    async def play_playlist(self, ctx: commands.Context, name: str) -> str:
+        """
+        Start a playlist without waiting for all of it to be queued.
+
+        The bot joins the author's channel through the Audio cog if needed, the list is resolved
+        once, and its first track is enqueued and started right away, so it plays (and the
+        controller appears) as quickly as a single play. The rest is enqueued in background chunks,
+        with progress shown on the controller. Spotify links, restricted Audio settings and authors
+        the bot cannot join hand the whole playlist to the Audio cog instead. Returns the message
+        to show the user.
+        """
+        if name.startswith(("http://", "https://")):
+            playlist = None
+            query_obj = self.classify_query(name)
+            restricted = query_obj is None or await self._audio_restricted(ctx, query_obj)
+        else:
+            playlist = await self.find_saved_playlist(ctx, name)
+            if playlist is None:
+                return f"No playlist named `{name}` was found."
+            if not playlist.tracks:
+                return f"The playlist `{playlist.name}` is empty."
+            restricted = await self._audio_restricted(ctx)
+        player = None if restricted else await self._playlist_player(ctx)
+        if player is None:
+            if playlist is None:
+                await self.command_eplay(ctx, query=name)
+            else:
+                await self.run_audio_command(
+                    "command_playlist_start", ctx, playlist_matches=self._playlist_matches(playlist, name)
+                )
+            return "Playlist queued!"
+        if playlist is None:
+            result = await self.resolve_query(player, query_obj)
+            if result.has_error or not result.tracks:
+                return "No tracks were found for that link."
+            title = result.playlist_info.name if result.is_playlist and result.playlist_info else name
+            tracks = list(result.tracks)
+        else:
+            title = playlist.name
+            tracks = playlist.tracks  # Stored already resolved, as raw track dicts
+        if len(player.queue) >= MAX_QUEUE_LENGTH:
+            return f"The queue is full, so `{title}` was not queued."
+        self.cancel_playlist_load(ctx.guild.id)
+        first = tracks[0]
+        self._enqueue_track(ctx, player, lavalink.rest_api.Track(first) if isinstance(first, dict) else first)
+        player.store("notify_channel", ctx.channel.id)
+        if not player.current:
+            self.metrics.count("lavalink_call")
+            await player.play()
+        await self.show_controller(ctx)
+        rest = tracks[1:]
+        if not rest:
+            return f"Playing `{title}`."
+        load = self.playlist_loads[ctx.guild.id] = PlaylistLoad(title, len(rest))
+        load.task = asyncio.get_event_loop().create_task(self._enqueue_playlist(ctx, player, load, rest))
+        return f"Playing `{title}`; queueing {humanize_number(len(rest))} more tracks."
+
+    async def _playlist_player(self, ctx: commands.Context) -> Optional[lavalink.Player]:
+        """
+        Return the player in the author's voice channel, joining it first if the bot is not connected.
+
+        Joining goes through the Audio cog's summon command, which runs its voice checks, followed
+        by the repeat, shuffle and volume settings its play command applies to a new player.
+        """
+        try:
+            connected = bool(lavalink.get_player(ctx.guild.id).channel)
+        except KeyError:
+            connected = False
+        if not connected and ctx.author.voice and ctx.author.voice.channel:
+            await self.run_audio_command("command_summon", ctx)
+            try:
+                lavalink.get_player(ctx.guild.id)
+            except KeyError:
+                return None
+            await self.original_cog.set_player_settings(ctx)
+        try:
+            player = lavalink.get_player(ctx.guild.id)
+        except KeyError:
+            return None
+        if not player.channel or not (ctx.author.voice and ctx.author.voice.channel == player.channel):
+            return None
+        return player
+
+    async def _enqueue_playlist(self, ctx: commands.Context, player: lavalink.Player, load: PlaylistLoad, tracks):
+        guild_id = ctx.guild.id
+        try:
+            for i in range(0, len(tracks), PLAYLIST_CHUNK_SIZE):
+                if not player.channel:
+                    break
+                for data in tracks[i : i + PLAYLIST_CHUNK_SIZE]:
+                    if len(player.queue) >= MAX_QUEUE_LENGTH:
+                        break
+                    track = lavalink.rest_api.Track(data) if isinstance(data, dict) else data
+                    self._enqueue_track(ctx, player, track)
+                    load.enqueued += 1
+                player.maybe_shuffle()
+                if guild_id in self.sessions and self.sessions[guild_id].view is not None:
+                    self.refresh_scheduler.reschedule(guild_id, EVENT_REFRESH_DELAY, only_earlier=True)
+                if len(player.queue) >= MAX_QUEUE_LENGTH:
+                    break
+                await asyncio.sleep(0)
+        except Exception as e:
+            log.error(f"[EnhancedAudio] Error enqueueing playlist {load.name} in guild {guild_id}: {e}")
+        finally:
+            if self.playlist_loads.get(guild_id) is load:
+                del self.playlist_loads[guild_id]
+            if guild_id in self.sessions and self.sessions[guild_id].view is not None:
+                self.refresh_scheduler.reschedule(guild_id, EVENT_REFRESH_DELAY, only_earlier=True)
+
+    def cancel_playlist_load(self, guild_id: int):
+        load = self.playlist_loads.pop(guild_id, None)
+        if load is not None and load.task is not None:
+            load.task.cancel()
+
+    def playlist_progress(self, guild_id: int) -> Optional[str]:
+        load = self.playlist_loads.get(guild_id)
+        if load is None:
+            return None
+        return f"{load.name}: {humanize_number(load.enqueued)}/{humanize_number(load.total)} tracks queued"
+
+    def _session(self, guild_id: int) -> GuildSession:
+        session = self.sessions.get(guild_id)
+        if session is None:
+            session = self.sessions[guild_id] = GuildSession()
+        return session
+
+    def _release_session(self, guild_id: int):
+        session = self.sessions.get(guild_id)
+        if session is not None and session.is_empty():
+            del self.sessions[guild_id]
+
+    def get_controller_message(self, guild_id: int) -> Optional[discord.PartialMessage]:
+        """Return the registered now-playing message of a guild without any API call."""
+        session = self.sessions.get(guild_id)
+        if session is None or session.message_id is None:
+            return None
+        channel = self.bot.get_channel(session.channel_id)
+        if channel is None:
+            return None
+        return channel.get_partial_message(session.message_id)
+
+    async def set_controller_message(self, guild_id: int, channel_id: int, message_id: int, owner_id: int):
+        session = self._session(guild_id)
+        if (session.channel_id, session.message_id, session.owner_id) == (channel_id, message_id, owner_id):
+            return
+        session.channel_id, session.message_id, session.owner_id = channel_id, message_id, owner_id
+        self.metrics.count("config_write")
+        await self.config.guild_from_id(guild_id).controller.set([channel_id, message_id, owner_id])
+
+    async def clear_controller_message(self, guild_id: int):
+        session = self.sessions.get(guild_id)
+        if session is None or session.message_id is None:
+            return
+        session.channel_id = session.message_id = session.owner_id = None
+        self._release_session(guild_id)
+        self.metrics.count("config_write")
+        await self.config.guild_from_id(guild_id).controller.clear()
+
+    async def end_session(self, guild_id: int):
+        """Forget everything about a guild's controller once it has been torn down."""
+        session = self.sessions.get(guild_id)
+        if session is None:
+            return
+        session.last_activity = None
+        self.inactivity_scheduler.cancel(guild_id)
+        actor = self.control_actors.pop(guild_id, None)
+        if actor is not None:
+            actor.cancel()
+        self.cancel_playlist_load(guild_id)
+        if session.view is not None:
+            session.view.stop()
+        await self.clear_controller_message(guild_id)
+        self._release_session(guild_id)
+
+    async def adopt_controller(self, interaction: discord.Interaction) -> Optional[EnhancedAudioView]:
+        """
+        Attach a live view to a registered controller message that lost its own view.
+
+        The view is owned by the member who started the controller, so presses by anyone else keep
+        going through the usual ``_can_instaskip`` check. When that member is gone (or the record
+        predates owner tracking), only a member who passes that check, or requested the current
+        track, may adopt it; they are then answered here and None is returned.
+        """
+        guild = interaction.guild
+        if guild is None or not self.original_cog or interaction.message is None:
+            return None
+        session = self.sessions.get(guild.id)
+        if session is None or session.message_id != interaction.message.id:
+            return None
+        view = session.view
+        if view and view.message and view.message.id == session.message_id and not view.is_finished():
+            return view
+        # Component interactions carry no command, so build the context from the message
+        owner = guild.get_member(session.owner_id) if session.owner_id else None
+        message = copy(interaction.message)
+        message.author = owner or interaction.user
+        ctx = await self.bot.get_context(message)
+        if owner is None and not await self._may_adopt(ctx, interaction.user):
+            await interaction.response.send_message(
+                "You do not have permission to use these controls.", ephemeral=True
+            )
+            return None
+        view = EnhancedAudioView(self, ctx)
+        view.message = interaction.message
+        self.touch_activity(guild.id)
+        await view.start()
+        return view
+
+    async def _may_adopt(self, ctx: commands.Context, member: discord.Member) -> bool:
+        try:
+            current = lavalink.get_player(ctx.guild.id).current
+        except KeyError:
+            current = None
+        requester = getattr(current, "requester", None)
+        if requester is not None and getattr(requester, "id", requester) == member.id:
+            return True
+        return await self.original_cog._can_instaskip(ctx, member)
+
+    def register_view(self, view: EnhancedAudioView):
+        """Attach ``view`` as the guild's only controller, handing over from the previous one."""
+        guild_id = view.ctx.guild.id
+        previous = self.sessions[guild_id].view if guild_id in self.sessions else None
+        if previous is not None and previous is not view:
+            previous.stop()
+            if previous.message and view.message and previous.message.id != view.message.id:
+                # The old message stays in the channel; leave it without dead buttons
+                self.edit_coalescer.submit(previous.message, final=True, view=None)
+        session = self._session(guild_id)
+        session.view = view
+        self.view_refs.add(view)
+        interval = session.refresh_interval = self.refresh_interval(guild_id)
+        session.refresh_handle = self.refresh_scheduler.schedule(guild_id, interval, interval=interval)
+
+    def unregister_view(self, view: EnhancedAudioView):
+        guild_id = view.ctx.guild.id
+        session = self.sessions.get(guild_id)
+        if session is not None and session.view is view:
+            session.view = None
+            session.refresh_handle = session.refresh_interval = None
+            self.refresh_scheduler.cancel(guild_id)
+            self._release_session(guild_id)
+        if view.message:
+            self.edit_coalescer.forget(view.message.id)
+            self.now_playing_renderer.forget(guild_id)
+
+    async def lavalink_event_handler(
+        self, player: lavalink.Player, event_type: lavalink.LavalinkEvents, extra
+    ):
+        if event_type not in CONTROLLER_EVENTS:
+            return
+        guild_id = player.guild.id
+        session = self.sessions.get(guild_id)
+        if session is None:
+            return
+        if event_type == lavalink.LavalinkEvents.QUEUE_END and session.last_activity is not None:
+            # The inactivity timeout counts from the moment playback ran out
+            self.touch_activity(guild_id)
+        if session.view is not None:
+            # Pull the next refresh forward; the fallback poll keeps its interval
+            handle = self.refresh_scheduler.reschedule(guild_id, EVENT_REFRESH_DELAY, only_earlier=True)
+            if handle is not None and handle != session.refresh_handle:
+                # Events already sharing a pending refresh are free
+                session.refresh_handle = handle
+                self.refresh_budget.spend()
+
+    async def _refresh_controllers(self, guild_ids):
+        if self.bot.is_closed():
+            return
+        views = []
+        active = self.active_controllers()
+        for guild_id in guild_ids:
+            session = self.sessions.get(guild_id)
+            view = session.view if session else None
+            if view is None or view.is_finished():
+                self.refresh_scheduler.cancel(guild_id)
+                continue
+            views.append(view)
+            # Pick up budget changes: the next fallback refresh follows the current interval
+            interval = session.refresh_interval = self.refresh_interval(guild_id, active)
+            session.refresh_handle = self.refresh_scheduler.schedule(guild_id, interval, interval=interval)
+        await asyncio.gather(*(view.update_now_playing() for view in views), return_exceptions=True)
+
+    def active_controllers(self) -> int:
+        return sum(1 for session in self.sessions.values() if session.view)
+
+    def refresh_interval(self, guild_id: int, active: Optional[int] = None) -> float:
+        """The guild's current fallback refresh interval under the global refresh budget."""
+        if active is None:
+            active = self.active_controllers()
+        return self.refresh_budget.interval(active, self.refresh_overrides.get(guild_id))
+
+    def metrics_gauges(self) -> Dict[str, float]:
+        return {
+            "sessions": len(self.sessions),
+            "live_views": self.active_controllers(),
+            "view_objects": sum(1 for view in self.view_refs if not view.is_finished()),
+            "edit_tasks": len(self.edit_coalescer),
+            "outbound_controller_depth": self.outbound.depth[OutboundQueue.CONTROLLER],
+            "outbound_cleanup_depth": self.outbound.depth[OutboundQueue.CLEANUP],
+            "outbound_in_flight": self.outbound.in_flight,
+            "outbound_shed": self.outbound.shed,
+            "interactions_in_flight": self.outbound.interactions,
+            "queued_controls": sum(len(actor) for actor in self.control_actors.values()),
+            "controls_merged": sum(actor.merged for actor in self.control_actors.values()),
+            "playlist_loads": len(self.playlist_loads),
+            "refresh_entries": len(self.refresh_scheduler),
+            "refresh_interval": self.refresh_budget.interval(self.active_controllers()),
+            "refresh_backoff": self.refresh_budget.backoff,
+            "rate_limits": self.refresh_budget.rate_limits,
+            "inactivity_entries": len(self.inactivity_scheduler),
+            "cleanup_entries": len(self.cleanup_scheduler),
+            "pending_notifications": sum(len(i) for i in self.notification_index.values()),
+            "track_description_entries": len(self.track_descriptions),
+            "track_description_hits": self.track_descriptions.hits,
+            "track_description_misses": self.track_descriptions.misses,
+            "query_cache_entries": len(self.query_cache),
+            "query_cache_memory_hits": self.query_cache.memory_hits,
+            "query_cache_disk_hits": self.query_cache.disk_hits,
+            "query_cache_misses": self.query_cache.misses,
+            "query_cache_hit_rate": self.query_cache.hit_rate,
+            "edits_coalesced": self.edit_coalescer.coalesced,
+            "edits_skipped": self.edit_coalescer.skipped,
+            "renders_unchanged": self.now_playing_renderer.hits,
+            "renders": self.now_playing_renderer.misses,
+        }
+
+    async def write_metrics_file(self) -> Path:
+        path = cog_data_path(self) / "metrics.prom"
+        text = self.metrics.to_prometheus(self.metrics_gauges())
+
+        def write():
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(text, encoding="utf-8")
+            tmp.replace(path)
+
+        await self.bot.loop.run_in_executor(None, write)
+        return path
+
+    @tasks.loop(seconds=METRICS_EXPORT_INTERVAL)
+    async def export_metrics(self):
+        try:
+            await self.write_metrics_file()
+        except Exception as e:
+            log.error(f"Error writing metrics file: {e}")
 
-    @tasks.loop(seconds=15)
-    async def inactivity_check(self):
+    def touch_activity(self, guild_id: int):
+        """Record activity in a guild and push its inactivity deadline back."""
+        self._session(guild_id).last_activity = time.time()
+        self.inactivity_scheduler.schedule(guild_id, INACTIVITY_TIMEOUT)
+
+    async def inactivity_check(self, guild_ids):
+        # Only called for guilds whose inactivity deadline has passed
         current_time = time.time()
-        for guild_id, last_time in list(self.last_activity.items()):
-            if current_time - last_time > 60:
-                guild = self.bot.get_guild(guild_id)
-                if guild:
-                    player = lavalink.get_player(guild_id)
-                    disconnected = False
-                    if player and not player.current:
-                        if getattr(player, 'channel_id', None):
-                            try:
-                                await player.disconnect()
-                                disconnected = True
-                                log.info(f"[EnhancedAudio] Disconnected lavalink player for guild {guild_id}")
-                            except Exception as e:
-                                log.error(f"[EnhancedAudio] Error disconnecting lavalink player: {e}")
-                        # Forçar desconexão pelo bot do Discord se ainda estiver conectado
-                        voice = guild.voice_client
-                        if voice:
-                            try:
-                                await voice.disconnect(force=True)
-                                disconnected = True
-                                log.info(f"[EnhancedAudio] Force-disconnected Discord voice client for guild {guild_id}")
-                            except Exception as e:
-                                log.error(f"[EnhancedAudio] Error force-disconnecting Discord voice client: {e}")
-                        if not disconnected:
-                            log.warning(f"[EnhancedAudio] Could not disconnect from voice in guild {guild_id}")
-                        last_message = self.last_messages.get(guild_id)
-                        if last_message:
-                            try:
-                                await last_message.delete()
-                            except (discord.NotFound, discord.Forbidden):
-                                pass
-                        self.last_activity.pop(guild_id, None)
-                        self.last_messages.pop(guild_id, None)
+        idle = []
+        for guild_id in guild_ids:
+            session = self.sessions.get(guild_id)
+            last_time = session.last_activity if session else None
+            if last_time is None:
+                continue
+            if current_time - last_time < INACTIVITY_TIMEOUT:
+                self.inactivity_scheduler.schedule(
+                    guild_id, last_time + INACTIVITY_TIMEOUT - current_time
+                )
+                continue
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                await self.end_session(guild_id)
+                continue
+            try:
+                player = lavalink.get_player(guild_id)
+            except KeyError:
+                player = None
+            if player and player.current:
+                # Still playing, look again once another timeout has passed
+                self.inactivity_scheduler.schedule(guild_id, INACTIVITY_TIMEOUT)
+                continue
+            idle.append((guild, player))
+        if not idle:
+            return
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(self._teardown_idle_guild(guild, player) for guild, player in idle)
+        )
+        duration = time.monotonic() - started
+        self.last_idle_sweep = {
+            "guilds": len(idle),
+            "timed_out": results.count(False),
+            "duration": duration,
+            "finished_at": time.time(),
+        }
+        log.debug(
+            f"[EnhancedAudio] Idle sweep disconnected {len(idle)} guild(s) in {duration:.2f}s"
+            f" ({results.count(False)} timed out)"
+        )
+
+    async def _teardown_idle_guild(self, guild: discord.Guild, player: Optional[lavalink.Player]) -> bool:
+        async with self.idle_teardown_semaphore:
+            try:
+                await asyncio.wait_for(
+                    self._disconnect_idle_guild(guild, player), self.idle_teardown_timeout
+                )
+                return True
+            except asyncio.TimeoutError:
+                log.warning(f"[EnhancedAudio] Timed out disconnecting idle guild {guild.id}")
+            except Exception as e:
+                log.error(f"[EnhancedAudio] Error disconnecting idle guild {guild.id}: {e}")
+            await self.end_session(guild.id)
+            return False
+
+    async def _disconnect_idle_guild(self, guild: discord.Guild, player: Optional[lavalink.Player]):
+        guild_id = guild.id
+        disconnected = False
+        if player and getattr(player, 'channel_id', None):
+            try:
+                self.metrics.count("lavalink_call")
+                await player.disconnect()
+                disconnected = True
+                log.info(f"[EnhancedAudio] Disconnected lavalink player for guild {guild_id}")
+            except Exception as e:
+                log.error(f"[EnhancedAudio] Error disconnecting lavalink player: {e}")
+        # Forçar desconexão pelo bot do Discord se ainda estiver conectado
+        voice = guild.voice_client
+        if voice:
+            try:
+                await voice.disconnect(force=True)
+                disconnected = True
+                log.info(f"[EnhancedAudio] Force-disconnected Discord voice client for guild {guild_id}")
+            except Exception as e:
+                log.error(f"[EnhancedAudio] Error force-disconnecting Discord voice client: {e}")
+        if not disconnected:
+            log.warning(f"[EnhancedAudio] Could not disconnect from voice in guild {guild_id}")
+        last_message = self.get_controller_message(guild_id)
+        if last_message:
+            try:
+                self.metrics.count("message_delete")
+                await self.outbound.submit(OutboundQueue.CLEANUP, guild_id, last_message.delete)
+            except (discord.NotFound, discord.Forbidden, asyncio.QueueFull):
+                pass
+        await self.end_session(guild_id)
 
     async def cog_unload(self):
-        if self.inactivity_task:
-            self.inactivity_task.cancel()
+        self.export_metrics.cancel()
+        logging.getLogger("discord.http").removeHandler(self.rate_limit_watcher)
+        if self.persistent_view:
+            self.persistent_view.stop()
+        self.inactivity_scheduler.stop()
+        lavalink.unregister_event_listener(self.lavalink_event_handler)
+        self.refresh_scheduler.stop()
+        self.cleanup_scheduler.stop()
+        for session in list(self.sessions.values()):
+            if session.view is not None:
+                session.view.stop()
+        self.edit_coalescer.cancel_all()
+        self.outbound.stop()
+        self.query_cache.close()
+        for actor in self.control_actors.values():
+            actor.cancel()
+        self.control_actors.clear()
+        for guild_id in list(self.playlist_loads):
+            self.cancel_playlist_load(guild_id)
+        self.requester_index.clear()
 
     @commands.Cog.listener()
     async def on_red_api_tokens_update(self, service_name, api_tokens):
@@ -576,25 +2505,94 @@ class EnhancedAudio(commands.Cog):
             return
         if not message.embeds and not message.content:
             return
-        try:
-            if message.embeds:
-                embed = message.embeds[0]
-                if embed.title and any(
-                    t in embed.title.lower() for t in [
-                        "track paused", "track resumed", "volume", "track enqueued", "track added"
-                    ]
-                ):
-                    try:
-                        await message.delete()
-                    except Exception:
-                        pass
-        except Exception as e:
-            log.error(f"Error processing message: {e}")
+        try:
+            if is_audio_notification(message):
+                # Deleted in bulk by _flush_notifications
+                self._track_notification(message.channel.id, message.id)
+                if message.channel.id not in self.cleanup_scheduler:
+                    self.cleanup_scheduler.schedule(message.channel.id, self.cleanup_flush_interval)
+        except Exception as e:
+            log.error(f"Error processing message: {e}")
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.requester_index.add(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.requester_index.remove(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.name != after.name or before.display_name != after.display_name:
+            self.requester_index.remove(before)
+            self.requester_index.add(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if before.name == after.name:
+            return
+        for guild_id in self.requester_index.indexed_guilds():
+            guild = self.bot.get_guild(guild_id)
+            member = guild.get_member(after.id) if guild else None
+            if member:
+                self.requester_index.remove(member, names=(before.name, before.display_name))
+                self.requester_index.add(member)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.requester_index.drop(guild.id)
+        actor = self.control_actors.pop(guild.id, None)
+        if actor is not None:
+            actor.cancel()
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        self._forget_notification(payload.channel_id, payload.message_id)
+        await self._forget_controller_message(payload.guild_id, payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        for message_id in payload.message_ids:
+            self._forget_notification(payload.channel_id, message_id)
+            await self._forget_controller_message(payload.guild_id, message_id)
+
+    async def _forget_controller_message(self, guild_id: Optional[int], message_id: int):
+        session = self.sessions.get(guild_id)
+        if session is not None and session.message_id == message_id:
+            await self.clear_controller_message(guild_id)
+
+    def _track_notification(self, channel_id: int, message_id: int):
+        index = self.notification_index.get(channel_id)
+        if index is None:
+            index = self.notification_index[channel_id] = deque()
+        index.append(message_id)
+        if len(index) >= NOTIFICATION_INDEX_SIZE:
+            # Never evict an undeleted notification; flush a full index right away instead
+            self.cleanup_scheduler.schedule(channel_id, 0)
+
+    def _forget_notification(self, channel_id: int, message_id: int):
+        index = self.notification_index.get(channel_id)
+        if not index:
+            return
+        with contextlib.suppress(ValueError):
+            index.remove(message_id)
+        if not index:
+            del self.notification_index[channel_id]
+            self.cleanup_deferred_since.pop(channel_id, None)
+
+    @staticmethod
+    def queue_page_count(player: lavalink.Player) -> int:
+        return max(1, math.ceil(len(player.queue) / QUEUE_PAGE_SIZE))
+
+    async def create_queue_page(self, ctx, page: int, rows: Optional[dict] = None) -> discord.Embed:
+        """
+        Render one queue page; only the tracks on that page are described.
 
-    async def create_queue_pages(self, ctx):
+        ``rows`` maps queue positions to ``(track, description)`` and is used and filled as a
+        cache; a row is only reused while the same track is still at its position.
+        """
         player = lavalink.get_player(ctx.guild.id)
-        items_per_page = 10
-        pages = []
         queue_list = player.queue
         if not queue_list:
             embed = discord.Embed(
@@ -603,46 +2601,35 @@ class EnhancedAudio(commands.Cog):
                 color=0x3498DB,
             )
             if player.current:
-                current = (
-                    await self.original_cog.get_track_description(
-                        player.current, self.original_cog.local_folder_current_path
-                    )
-                    or "Unknown"
-                )
-                embed.add_field(
-                    name="🎵 Now Playing", value=f"**{current}**", inline=False
-                )
-            pages.append(embed)
-            return pages
-        for i in range(0, len(queue_list), items_per_page):
-            queue_chunk = queue_list[i : i + items_per_page]
-            embed = discord.Embed(title="📋 Queue", color=0x3498DB)
-            if i == 0 and player.current:
-                current = (
-                    await self.original_cog.get_track_description(
-                        player.current, self.original_cog.local_folder_current_path
-                    )
-                    or "Unknown"
-                )
+                current = await self.describe_track(player.current)
                 embed.add_field(
                     name="🎵 Now Playing", value=f"**{current}**", inline=False
                 )
-            queue_text = ""
-            for index, track in enumerate(queue_chunk, start=i + 1):
-                track_description = (
-                    await self.original_cog.get_track_description(
-                        track, self.original_cog.local_folder_current_path
-                    )
-                    or "Unknown"
-                )
-                queue_text += f"**{index}.** {track_description}\n"
-            if queue_text:
-                embed.description = queue_text
-            embed.set_footer(
-                text=f"Page {i//items_per_page + 1}/{math.ceil(len(queue_list)/items_per_page)} • Total: {len(queue_list)} tracks"
+            return embed
+        i = page * QUEUE_PAGE_SIZE
+        queue_chunk = queue_list[i : i + QUEUE_PAGE_SIZE]
+        embed = discord.Embed(title="📋 Queue", color=0x3498DB)
+        if i == 0 and player.current:
+            current = await self.describe_track(player.current)
+            embed.add_field(
+                name="🎵 Now Playing", value=f"**{current}**", inline=False
             )
-            pages.append(embed)
-        return pages
+        queue_text = ""
+        for index, track in enumerate(queue_chunk, start=i + 1):
+            row = rows.get(index - 1) if rows is not None else None
+            if row is not None and row[0] is track:
+                track_description = row[1]
+            else:
+                track_description = await self.describe_track(track)
+                if rows is not None:
+                    rows[index - 1] = (track, track_description)
+            queue_text += f"**{index}.** {track_description}\n"
+        if queue_text:
+            embed.description = queue_text
+        embed.set_footer(
+            text=f"Page {page + 1}/{self.queue_page_count(player)} • Total: {len(queue_list)} tracks"
+        )
+        return embed
 
     @commands.command(name="eplay")
     @commands.guild_only()
@@ -658,62 +2645,9 @@ class EnhancedAudio(commands.Cog):
             )
             return
         try:
-            await self.original_cog.command_play(ctx, query=query)
-            player = lavalink.get_player(ctx.guild.id)
-            if player.current:
-                last_message = self.last_messages.get(ctx.guild.id)
-                view = EnhancedAudioView(self, ctx)
-                if last_message:
-                    try:
-                        try:
-                            await last_message.channel.fetch_message(last_message.id)
-                            view.message = last_message
-                            await view.start()
-                            await view.update_now_playing()
-                            await last_message.edit(view=view)
-                            return
-                        except discord.NotFound:
-                            pass
-                        except discord.HTTPException as e:
-                            if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                                log.debug("Invalid webhook token in last message")
-                                pass
-                            else:
-                                raise
-                    except Exception as e:
-                        log.debug(f"Error updating last message: {e}")
-            
-            # Try to find a recent message
-            recent_msgs = [m async for m in ctx.channel.history(limit=5) if m.author == ctx.me and m.embeds and m.embeds[0].title == "🎵 Now Playing"]
-            if recent_msgs:
-                msg = recent_msgs[0]
-                view.message = msg
-                self.last_activity[ctx.guild.id] = time.time()
-                self.last_messages[ctx.guild.id] = msg
-                try:
-                    await view.start()
-                    await view.update_now_playing()
-                    await msg.edit(view=view)
-                    return
-                except discord.HTTPException as e:
-                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                        log.debug("Invalid webhook token in recent message")
-                        pass
-                    else:
-                        raise
-            
-            # Create a new message if needed
-            initial_embed = discord.Embed(
-                title="🎵 Now Playing",
-                description="Loading track information...",
-                color=0x3498DB,
-            )
-            message = await ctx.send(embed=initial_embed, view=view)
-            view.message = message
-            self.last_activity[ctx.guild.id] = time.time()
-            self.last_messages[ctx.guild.id] = message
-            await view.start()
-            await view.update_now_playing()
+            if not await self.play_cached(ctx, query):
+                await self.run_audio_command("command_play", ctx, query=query)
+            await self.show_controller(ctx)
         except Exception as e:
             log.error(f"Error in eplay command: {e}")
             try:
@@ -723,6 +2657,45 @@ class EnhancedAudio(commands.Cog):
             except Exception:
                 pass
 
+    async def show_controller(self, ctx: commands.Context):
+        """Attach a fresh controller to the registered Now Playing message, or send a new one."""
+        player = lavalink.get_player(ctx.guild.id)
+        if not player.current:
+            return
+        view = EnhancedAudioView(self, ctx)
+        # Reuse the registered controller message without fetching it first
+        message = self.get_controller_message(ctx.guild.id)
+        if message is not None:
+            try:
+                self.metrics.count("message_edit")
+                await message.edit(view=view)
+            except discord.NotFound:
+                await self.clear_controller_message(ctx.guild.id)
+            except discord.HTTPException as e:
+                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                    log.debug("Invalid webhook token in last message")
+                else:
+                    raise
+            else:
+                view.message = message
+                self.touch_activity(ctx.guild.id)
+                await view.start()
+                await view.update_now_playing()
+                return
+
+        # Create a new message if needed
+        initial_embed = discord.Embed(
+            title="🎵 Now Playing",
+            description="Loading track information...",
+            color=0x3498DB,
+        )
+        message = await ctx.send(embed=initial_embed, view=view)
+        view.message = message.channel.get_partial_message(message.id)
+        self.touch_activity(ctx.guild.id)
+        await self.set_controller_message(ctx.guild.id, message.channel.id, message.id, ctx.author.id)
+        await view.start()
+        await view.update_now_playing()
+
     @commands.command(name="enow")
     @commands.guild_only()
     @commands.bot_has_permissions(embed_links=True)
@@ -746,7 +2719,7 @@ class EnhancedAudio(commands.Cog):
                 return
             player = lavalink.get_player(ctx.guild.id)
             view = EnhancedAudioView(self, ctx)
-            guild_data = await self.original_cog.config.guild(ctx.guild).all()
+            guild_data = await self.get_audio_settings(ctx.guild)
             shuffle_button = [
                 x for x in view.children if x.emoji and x.emoji.name == "🔀"
             ][0]
@@ -772,9 +2745,9 @@ class EnhancedAudio(commands.Cog):
                 color=0x3498DB,
             )
             message = await ctx.send(embed=initial_embed, view=view)
-            view.message = message
-            self.last_activity[ctx.guild.id] = time.time()
-            self.last_messages[ctx.guild.id] = message
+            view.message = message.channel.get_partial_message(message.id)
+            self.touch_activity(ctx.guild.id)
+            await self.set_controller_message(ctx.guild.id, message.channel.id, message.id, ctx.author.id)
             await view.start()
             await view.update_now_playing()
         except Exception as e:
@@ -807,11 +2780,11 @@ class EnhancedAudio(commands.Cog):
                 )
                 await ctx.send(embed=embed)
                 return
-            pages = await self.create_queue_pages(ctx)
-            view = EnhancedQueueView(self, ctx, pages)
-            message = await ctx.send(embed=pages[0], view=view)
+            view = EnhancedQueueView(self, ctx)
+            embed = await view.show_page(0)
+            message = await ctx.send(embed=embed, view=view)
             view.message = message
-            self.last_activity[ctx.guild.id] = time.time()
+            self.touch_activity(ctx.guild.id)
         except Exception as e:
             log.error(f"Error in equeue command: {e}")
             try:
@@ -844,27 +2817,17 @@ class EnhancedAudio(commands.Cog):
                 return
             player = lavalink.get_player(ctx.guild.id)
             current_track = player.current
-            self.last_activity[ctx.guild.id] = time.time()
-            await self.original_cog.command_skip(ctx)
+            self.touch_activity(ctx.guild.id)
+            await self.control(ctx, ctx.author, "skip")
             if current_track:
-                track_description = (
-                    await self.original_cog.get_track_description(
-                        current_track, self.original_cog.local_folder_current_path
-                    )
-                    or "Unknown"
-                )
+                track_description = await self.describe_track(current_track)
                 embed = discord.Embed(
                     title="⏭️ Track Skipped",
                     description=f"**{track_description}**",
                     color=0x3498DB,
                 )
                 if player.current:
-                    next_track = (
-                        await self.original_cog.get_track_description(
-                            player.current, self.original_cog.local_folder_current_path
-                        )
-                        or "Unknown"
-                    )
+                    next_track = await self.describe_track(player.current)
                     embed.add_field(
                         name="🎵 Now Playing", value=f"**{next_track}**", inline=False
                     )
@@ -878,216 +2841,433 @@ class EnhancedAudio(commands.Cog):
             except Exception:
                 pass
 
+    @commands.group(name="eaudioset")
+    @commands.guild_only()
+    @commands.admin_or_permissions(manage_guild=True)
+    async def command_eaudioset(self, ctx: commands.Context):
+        """
+        Configure the enhanced audio system.
+        """
+
+    @command_eaudioset.command(name="flushinterval")
+    @commands.is_owner()
+    async def command_eaudioset_flushinterval(self, ctx: commands.Context, seconds: float):
+        """
+        Set how many seconds Audio cog notifications wait before they are bulk-deleted.
+        """
+        if not 0.5 <= seconds <= 60:
+            await ctx.send("The flush interval must be between 0.5 and 60 seconds.")
+            return
+        await self.config.cleanup_flush_interval.set(seconds)
+        self.cleanup_flush_interval = seconds
+        await ctx.send(f"Audio cog notifications will be deleted every {seconds:g} seconds.")
+
+    @command_eaudioset.command(name="fastcontrols")
+    async def command_eaudioset_fastcontrols(self, ctx: commands.Context, enabled: bool):
+        """
+        Toggle fast controls, which drive the player directly instead of the Audio commands.
+
+        Pause, volume and restart then cost a single Lavalink call. The Audio cog's voice
+        channel and DJ checks still apply; members who fail them fall back to its commands.
+        """
+        await self.config.guild(ctx.guild).fast_controls.set(enabled)
+        if enabled:
+            self.fast_control_guilds.add(ctx.guild.id)
+            await ctx.send("Fast controls are now enabled for this server.")
+        else:
+            self.fast_control_guilds.discard(ctx.guild.id)
+            await ctx.send("Fast controls are now disabled for this server.")
+
+    @command_eaudioset.command(name="refresh")
+    async def command_eaudioset_refresh(self, ctx: commands.Context, seconds: Optional[float] = None):
+        """
+        Set how often this server's controller refreshes when no track event happens.
+
+        The bot-wide refresh budget can still stretch this when many servers have a controller.
+        Leave `seconds` out to follow the budget again. At 30 seconds or less the controller shows
+        a live progress bar.
+        """
+        if seconds is None:
+            await self.config.guild(ctx.guild).refresh_interval.clear()
+            self.refresh_overrides.pop(ctx.guild.id, None)
+            await ctx.send("The controller now refreshes according to the bot-wide refresh budget.")
+            return
+        if not MIN_REFRESH_INTERVAL <= seconds <= REFRESH_INTERVAL:
+            await ctx.send(
+                f"The refresh interval must be between {MIN_REFRESH_INTERVAL} and {REFRESH_INTERVAL} seconds."
+            )
+            return
+        await self.config.guild(ctx.guild).refresh_interval.set(seconds)
+        self.refresh_overrides[ctx.guild.id] = seconds
+        await ctx.send(
+            f"The controller will refresh every {seconds:g} seconds, slower while the bot-wide refresh "
+            f"budget is busy or Discord rate limits the bot."
+        )
+
+    @command_eaudioset.command(name="refreshbudget")
+    @commands.is_owner()
+    async def command_eaudioset_refreshbudget(self, ctx: commands.Context, edits_per_minute: int):
+        """
+        Set how many background controller edits per minute the bot spends across all servers.
+        """
+        if not 1 <= edits_per_minute <= 600:
+            await ctx.send("The refresh budget must be between 1 and 600 edits per minute.")
+            return
+        await self.config.refresh_budget.set(edits_per_minute)
+        self.refresh_budget.edits_per_minute = edits_per_minute
+        await ctx.send(f"Controllers will share {edits_per_minute} background edits per minute.")
+
+    @command_eaudioset.command(name="teardown")
+    @commands.is_owner()
+    async def command_eaudioset_teardown(
+        self, ctx: commands.Context, concurrency: int, timeout: float
+    ):
+        """
+        Set how many idle guilds are disconnected at once and the time limit for each.
+        """
+        if not 1 <= concurrency <= 100:
+            await ctx.send("The concurrency must be between 1 and 100.")
+            return
+        if not 1 <= timeout <= 120:
+            await ctx.send("The timeout must be between 1 and 120 seconds.")
+            return
+        await self.config.idle_teardown_concurrency.set(concurrency)
+        await self.config.idle_teardown_timeout.set(timeout)
+        self.idle_teardown_semaphore = asyncio.Semaphore(concurrency)
+        self.idle_teardown_timeout = timeout
+        message = f"Up to {concurrency} idle guilds will be disconnected at once, {timeout:g} seconds each."
+        if self.last_idle_sweep:
+            message += (
+                f"\nLast sweep: {self.last_idle_sweep['guilds']} guild(s) in"
+                f" {self.last_idle_sweep['duration']:.2f}s, {self.last_idle_sweep['timed_out']} timed out."
+            )
+        await ctx.send(message)
+
+    @command_eaudioset.command(name="metrics")
+    @commands.is_owner()
+    async def command_eaudioset_metrics(self, ctx: commands.Context):
+        """
+        Show command latencies and API call counts, and write them to the metrics file.
+        """
+        lines = [f"{'latency':<24} {'count':>7} {'mean':>8} {'p50':>8} {'p95':>8}"]
+        for kind, name, count, mean, p50, p95 in self.metrics.summary():
+            lines.append(
+                f"{kind + ':' + name:<24} {count:>7} {mean * 1000:>6.1f}ms"
+                f" {'-' if p50 is None else f'<{p50 * 1000:g}ms':>8}"
+                f" {'-' if p95 is None else f'<{p95 * 1000:g}ms':>8}"
+            )
+        lines.append("")
+        for name, value in sorted(self.metrics.counters.items()):
+            lines.append(f"{name:<24} {value:>7}")
+        for name, value in sorted(self.metrics_gauges().items()):
+            lines.append(f"{name:<24} {value:>7}")
+        path = await self.write_metrics_file()
+        for page in pagify("\n".join(lines), shorten_by=20):
+            await ctx.send(box(page))
+        await ctx.send(f"Prometheus metrics written to `{path}`.")
+
     # Slash commands
     @app_commands.command(name="play", description="Play a song or playlist")
     @app_commands.describe(query="Type a song name or URL")
+    @timed("slash", "play")
     async def slash_play(self, interaction: discord.Interaction, query: str):
         """
         Slash command: Play a song or playlist.
         """
-        try:
-            await interaction.response.defer(ephemeral=True)
-            ctx = await self.bot.get_context(interaction)
-            await self.command_eplay(ctx, query=query)
-            
-            # Only attempt to send followup if interaction hasn't expired
+        with self.outbound.interaction(interaction.guild_id):
             try:
-                await interaction.followup.send("Track added to queue!", ephemeral=True)
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token in slash play command")
-                    # Interaction expired, no need to handle further
-                    pass
-                else:
-                    raise
-        except Exception as e:
-            log.error(f"Error in slash play command: {e}")
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                await self.command_eplay(ctx, query=query)
+            
+                # Only attempt to send followup if interaction hasn't expired
+                try:
+                    await interaction.followup.send("Track added to queue!", ephemeral=True)
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash play command")
+                        # Interaction expired, no need to handle further
+                        pass
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash play command: {e}")
 
     @app_commands.command(name="pause", description="Pause the current track")
+    @timed("slash", "pause")
     async def slash_pause(self, interaction: discord.Interaction):
         """
         Slash command: Pause the current track.
         """
-        try:
-            await interaction.response.defer(ephemeral=True)
-            ctx = await self.bot.get_context(interaction)
-            await self.original_cog.command_pause(ctx)
-            
+        with self.outbound.interaction(interaction.guild_id):
             try:
-                await interaction.followup.send(_("Track paused!"), ephemeral=True)
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token in slash pause command")
-                    pass
-                else:
-                    raise
-        except Exception as e:
-            log.error(f"Error in slash pause command: {e}")
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                paused = await self.control(ctx, ctx.author, "pause")
+            
+                try:
+                    await interaction.followup.send(
+                        _("Track paused!") if paused else _("Track resumed!"), ephemeral=True
+                    )
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash pause command")
+                        pass
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash pause command: {e}")
 
     @app_commands.command(name="stop", description="Stop playback")
+    @timed("slash", "stop")
     async def slash_stop(self, interaction: discord.Interaction):
         """
         Slash command: Stop music playback.
         """
-        try:
-            await interaction.response.defer(ephemeral=True)
-            ctx = await self.bot.get_context(interaction)
-            await self.original_cog.command_stop(ctx)
-            
+        with self.outbound.interaction(interaction.guild_id):
             try:
-                await interaction.followup.send("Playback stopped!", ephemeral=True)
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token in slash stop command")
-                    pass
-                else:
-                    raise
-        except Exception as e:
-            log.error(f"Error in slash stop command: {e}")
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                await self.control(ctx, ctx.author, "stop")
+            
+                try:
+                    await interaction.followup.send("Playback stopped!", ephemeral=True)
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash stop command")
+                        pass
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash stop command: {e}")
 
     @app_commands.command(name="skip", description="Skip the current track")
+    @timed("slash", "skip")
     async def slash_skip(self, interaction: discord.Interaction):
         """
         Slash command: Skip the current track.
         """
-        try:
-            await interaction.response.defer(ephemeral=True)
-            ctx = await self.bot.get_context(interaction)
-            await self.command_eskip(ctx)
-            
+        with self.outbound.interaction(interaction.guild_id):
             try:
-                await interaction.followup.send("Track skipped!", ephemeral=True)
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token in slash skip command")
-                    pass
-                else:
-                    raise
-        except Exception as e:
-            log.error(f"Error in slash skip command: {e}")
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                await self.command_eskip(ctx)
+            
+                try:
+                    await interaction.followup.send("Track skipped!", ephemeral=True)
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash skip command")
+                        pass
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash skip command: {e}")
 
     @app_commands.command(name="queue", description="Show the queue")
+    @timed("slash", "queue")
     async def slash_queue(self, interaction: discord.Interaction):
         """
         Slash command: Show the current music queue.
         """
-        try:
-            await interaction.response.defer(ephemeral=True)
-            ctx = await self.bot.get_context(interaction)
-            await self.command_equeue(ctx)
-            
+        with self.outbound.interaction(interaction.guild_id):
             try:
-                await interaction.followup.send("Queue shown above!", ephemeral=True)
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token in slash queue command")
-                    pass
-                else:
-                    raise
-        except Exception as e:
-            log.error(f"Error in slash queue command: {e}")
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                await self.command_equeue(ctx)
+            
+                try:
+                    await interaction.followup.send("Queue shown above!", ephemeral=True)
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash queue command")
+                        pass
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash queue command: {e}")
 
     @app_commands.command(name="repeat", description="Toggle repeat mode")
+    @timed("slash", "repeat")
     async def slash_repeat(self, interaction: discord.Interaction):
         """
         Slash command: Toggle repeat mode for playback.
         """
-        try:
-            await interaction.response.defer(ephemeral=True)
-            ctx = await self.bot.get_context(interaction)
-            await self.original_cog.command_repeat(ctx)
-            
+        with self.outbound.interaction(interaction.guild_id):
             try:
-                await interaction.followup.send("Repeat toggled!", ephemeral=True)
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token in slash repeat command")
-                    pass
-                else:
-                    raise
-        except Exception as e:
-            log.error(f"Error in slash repeat command: {e}")
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                await self.control(ctx, ctx.author, "repeat")
+                self.settings_cache.invalidate(ctx.guild.id)
+            
+                try:
+                    await interaction.followup.send("Repeat toggled!", ephemeral=True)
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash repeat command")
+                        pass
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash repeat command: {e}")
 
     @app_commands.command(name="shuffle", description="Shuffle the queue")
+    @timed("slash", "shuffle")
     async def slash_shuffle(self, interaction: discord.Interaction):
         """
         Slash command: Shuffle the current queue.
         """
-        try:
-            await interaction.response.defer(ephemeral=True)
-            ctx = await self.bot.get_context(interaction)
-            await self.original_cog.command_shuffle(ctx)
-            
+        with self.outbound.interaction(interaction.guild_id):
             try:
-                await interaction.followup.send("Queue shuffled!", ephemeral=True)
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token in slash shuffle command")
-                    pass
-                else:
-                    raise
-        except Exception as e:
-            log.error(f"Error in slash shuffle command: {e}")
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                await self.control(ctx, ctx.author, "shuffle")
+                self.settings_cache.invalidate(ctx.guild.id)
+            
+                try:
+                    await interaction.followup.send("Queue shuffled!", ephemeral=True)
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash shuffle command")
+                        pass
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash shuffle command: {e}")
 
     @app_commands.command(name="volume", description="Set the volume (0-150%)")
     @app_commands.describe(volume="New volume value between 1 and 150.")
+    @timed("slash", "volume")
     async def slash_volume(self, interaction: discord.Interaction, volume: app_commands.Range[int, 1, 150]):
         """
         Slash command: Set the playback volume.
         """
-        try:
-            await interaction.response.defer(ephemeral=True)
-            ctx = await self.bot.get_context(interaction)
-            await self.original_cog.command_volume(ctx, vol=volume)
-            
+        with self.outbound.interaction(interaction.guild_id):
             try:
-                await interaction.followup.send(f"Volume set to {volume}%!", ephemeral=True)
-            except discord.HTTPException as e:
-                if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
-                    log.debug("Invalid webhook token in slash volume command")
-                    pass
-                else:
-                    raise
-        except Exception as e:
-            log.error(f"Error in slash volume command: {e}")
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                volume = await self.control(ctx, ctx.author, "set_volume", volume)
+            
+                try:
+                    await interaction.followup.send(f"Volume set to {volume}%!", ephemeral=True)
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash volume command")
+                        pass
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash volume command: {e}")
 
-    # Playlist group (exemplo simplificado)
+    # Playlist group
     playlist = app_commands.Group(name="playlist", description="Playlist commands", guild_only=True)
 
-    @playlist.command(name="play", description="Play a playlist by name")
-    @app_commands.describe(playlist="The name of the playlist.")
+    @playlist.command(name="play", description="Play a saved playlist or a playlist link")
+    @app_commands.describe(playlist="The name or ID of a saved playlist, or a playlist URL.")
+    @timed("slash", "playlist_play")
     async def playlist_play(self, interaction: discord.Interaction, playlist: str):
         """
         Slash command: Play a playlist by name.
         """
-        ctx = await self.bot.get_context(interaction)
-        # Aqui você pode chamar a lógica de playlist do seu Audio cog
-        await interaction.response.send_message(f"Playlist '{playlist}' played!", ephemeral=True)
+        with self.outbound.interaction(interaction.guild_id):
+            try:
+                await interaction.response.defer(ephemeral=True)
+                ctx = await self.bot.get_context(interaction)
+                if not self.original_cog:
+                    await interaction.followup.send(
+                        "The original Audio cog was not found. This command will not work.", ephemeral=True
+                    )
+                    return
+                message = await self.play_playlist(ctx, playlist.strip())
+                try:
+                    await interaction.followup.send(message, ephemeral=True)
+                except discord.HTTPException as e:
+                    if e.status == 401 and e.code == 50027:  # Invalid Webhook Token
+                        log.debug("Invalid webhook token in slash playlist play command")
+                    else:
+                        raise
+            except Exception as e:
+                log.error(f"Error in slash playlist play command: {e}")
 
     # Adicione outros comandos de playlist conforme necessário
 
     # Utility para deletar mensagens embed do Audio cog original
     async def delete_audio_cog_embeds(self, ctx):
-        async for msg in ctx.channel.history(limit=10):
-            if msg.author == ctx.me and msg.embeds:
-                embed = msg.embeds[0]
-                if embed.title and any(
-                    t in embed.title.lower() for t in [
-                        "track paused", "track resumed", "volume", "track enqueued", "track added"
-                    ]
-                ):
-                    try:
-                        await msg.delete()
-                    except Exception:
-                        pass
+        # Flush the channel's pending notifications now instead of waiting for the next flush;
+        # the deletes run behind the interaction that asked for them
+        if ctx.channel.id in self.notification_index:
+            self.cleanup_scheduler.schedule(ctx.channel.id, 0)
+
+    async def _flush_notifications(self, channel_ids):
+        for channel_id in channel_ids:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                self.notification_index.pop(channel_id, None)
+                self.cleanup_deferred_since.pop(channel_id, None)
+                continue
+            await self.delete_notifications(channel)
+
+    async def delete_notifications(self, channel: discord.abc.Messageable):
+        """Delete the tracked Audio cog notifications of a channel, in bulk where possible."""
+        if channel.id not in self.notification_index:
+            return
+        deferred_since = self.cleanup_deferred_since.setdefault(channel.id, time.monotonic())
+        overdue = time.monotonic() - deferred_since >= CLEANUP_MAX_DEFER
+        if not overdue and self.outbound.pressured(OutboundQueue.CLEANUP):
+            # Leave them tracked and try again once the backlog has drained
+            self.cleanup_scheduler.schedule(channel.id, self.cleanup_flush_interval)
+            return
+        index = self.notification_index.pop(channel.id)
+        self.cleanup_deferred_since.pop(channel.id, None)
+        can_bulk = channel.permissions_for(channel.guild.me).manage_messages
+        cutoff = discord.utils.time_snowflake(discord.utils.utcnow() - BULK_DELETE_MAX_AGE)
+        recent = [discord.Object(id=m) for m in index if can_bulk and m > cutoff]
+        single = [m for m in index if not can_bulk or m <= cutoff]
+        for i in range(0, len(recent), BULK_DELETE_LIMIT):
+            chunk = recent[i : i + BULK_DELETE_LIMIT]
+            try:
+                self.metrics.count("message_bulk_delete")
+                await self.outbound.submit(
+                    OutboundQueue.CLEANUP, channel.guild.id, channel.delete_messages, chunk, shed=not overdue
+                )
+            except discord.NotFound:
+                pass
+            except asyncio.QueueFull:
+                for message in chunk:
+                    self._track_notification(channel.id, message.id)
+                self.cleanup_deferred_since.setdefault(channel.id, deferred_since)
+                self.cleanup_scheduler.schedule(channel.id, self.cleanup_flush_interval)
+            except discord.HTTPException as e:
+                log.debug(f"Bulk delete failed in channel {channel.id}, deleting one by one: {e}")
+                single.extend(m.id for m in chunk)
+        for message_id in single:
+            try:
+                self.metrics.count("message_delete")
+                await self.outbound.submit(
+                    OutboundQueue.CLEANUP, channel.guild.id, channel.get_partial_message(message_id).delete,
+                    shed=not overdue,
+                )
+            except asyncio.QueueFull:
+                self._track_notification(channel.id, message_id)
+                self.cleanup_deferred_since.setdefault(channel.id, deferred_since)
+                self.cleanup_scheduler.schedule(channel.id, self.cleanup_flush_interval)
+            except Exception:
+                pass
 
     async def red_delete_data_for_user(self, *, requester, user_id: int):
         """
         Delete all data associated with a user, as required by Red's data deletion API.
-        This cog only stores user IDs as requesters for tracks in memory, which are not persisted.
+        The only user ID this cog persists is the owner of each guild's controller; requesters of
+        tracks are only held in memory.
         """
-        # No persistent user data to delete; if you add persistent user data in the future, delete it here.
-        pass
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            controller = guild_data.get("controller")
+            if controller and len(controller) > 2 and controller[2] == user_id:
+                self.metrics.count("config_write")
+                await self.config.guild_from_id(guild_id).controller.set([*controller[:2], None])
+        for session in self.sessions.values():
+            if session.owner_id == user_id:
+                session.owner_id = None
 
     async def setup(bot):
         cog = EnhancedAudio(bot)